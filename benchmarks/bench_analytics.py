@@ -0,0 +1,70 @@
+"""
+Benchmark: group-by queries over the columnar order/rating store.
+
+Usage:
+    python -m benchmarks.bench_analytics [--orders 1000000]   (use 1e7 for the full run)
+"""
+
+import argparse
+import random
+import time
+
+from bitlabs import cart, restaurant
+from bitlabs.analytics import OrderEventStore
+
+
+def build_store(num_orders: int, rated_share: float = 0.7, seed: int = 0) -> OrderEventStore:
+    """Fills a store with random restaurant and cart orders, most of them rated."""
+    rng = random.Random(seed)
+    store = OrderEventStore()
+    menu_ids = list(restaurant.CATALOG)
+    product_ids = list(cart.CATALOG)
+    for order_id in range(1, num_orders + 1):
+        if rng.random() < 0.5:
+            item_ids = rng.sample(menu_ids, rng.randint(1, 3))
+            store.record_order(order_id, "restaurant", item_ids, rng.uniform(9, 60),
+                               rng.choice((0.0, 10.0)))
+        else:
+            item_ids = rng.sample(product_ids, rng.randint(1, 4))
+            store.record_order(order_id, "cart", item_ids, rng.uniform(800, 150000),
+                               rng.choice((0.0, 5.0, 15.0)))
+        if rng.random() < rated_share:
+            store.record_rating(order_id, rng.randint(1, 5))
+    return store
+
+
+def _timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<42} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=lambda s: int(float(s)), default=1_000_000)
+    args = parser.parse_args()
+
+    print("--- Order Analytics Benchmark ---")
+    store = _timed(f"ingest {args.orders:,} orders + ratings", lambda: build_store(args.orders))
+    print(f"  ({len(store.item_keys):,} ordered items)\n")
+
+    _timed("positive_percentage()", store.positive_percentage)
+    _timed("positive_percentage('cart')", lambda: store.positive_percentage("cart"))
+    by_menu_item = _timed("positive_percentage_by_item('restaurant')",
+                          lambda: store.positive_percentage_by_item("restaurant"))
+    _timed("positive_percentage_by_item('cart')", lambda: store.positive_percentage_by_item("cart"))
+    by_rating = _timed("average_discount_by_rating()", store.average_discount_by_rating)
+    _timed("average_total_by_rating('restaurant')",
+           lambda: store.average_total_by_rating("restaurant"))
+
+    print("\nPositive feedback per menu item:")
+    for item_id, percentage in by_menu_item.items():
+        print(f"  {restaurant.CATALOG[item_id]['name']:<10} {percentage:5.1f}%")
+    print("Average discount by rating:")
+    for rating, discount in by_rating.items():
+        print(f"  {rating}: {discount:5.2f}%")
+
+
+if __name__ == "__main__":
+    main()
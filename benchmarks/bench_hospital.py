@@ -0,0 +1,102 @@
+"""
+Benchmark: bulk patient import and batch disease queries vs. the per-record path.
+
+Usage:
+    python -m benchmarks.bench_hospital [--patients 200000]
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+
+from benchmarks import generators
+from bitlabs import hospital
+
+
+def _write_files(directory: str, patients: list) -> dict:
+    """Writes the patients as CSV and JSONL files and returns their paths."""
+    paths = {"csv": os.path.join(directory, "patients.csv"),
+             "jsonl": os.path.join(directory, "patients.jsonl")}
+    with open(paths["csv"], "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(hospital.IMPORT_FIELDS)
+        writer.writerows((p.name, p.age, p.disease) for p in patients)
+    with open(paths["jsonl"], "w") as f:
+        f.writelines(json.dumps(p.to_dict()) + "\n" for p in patients)
+    return paths
+
+
+def _per_record_import(path: str):
+    """The per-record path: each CSV row goes through add_patient on its own."""
+    with open(path, newline="") as f, open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        reader = csv.reader(f)
+        next(reader)
+        for name, age, disease in reader:
+            hospital.add_patient(name, age, disease)
+
+
+def _timed(func, repeats: int = 3, clear: bool = True) -> float:
+    """Returns the best wall time of ``func``, each run starting from empty records if ``clear``."""
+    best = float("inf")
+    for _ in range(repeats):
+        if clear:
+            hospital.patient_records.clear()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _rate(label: str, count: int, elapsed: float, baseline: float = None):
+    speedup = f"  ({baseline / elapsed:5.2f}x)" if baseline else ""
+    print(f"  {label:<28} {elapsed * 1000:10.1f} ms  {count / elapsed:>12,.0f} rec/s{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--patients", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.patients
+
+    patients = generators.patients(n, random.Random(0), hospital.Patient)
+    print("--- Hospital Bulk Operations Benchmark ---")
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_files(directory, patients)
+        print(f"\nImport of {n:,} patients")
+        per_record = _timed(lambda: _per_record_import(paths["csv"]))
+        _rate("per record (add_patient)", n, per_record)
+        _rate("import_patients (csv)", n, _timed(lambda: hospital.import_patients(paths["csv"])),
+              per_record)
+        _rate("import_patients (jsonl)", n, _timed(lambda: hospital.import_patients(paths["jsonl"])),
+              per_record)
+
+    hospital.patient_records[:] = patients
+    diseases = generators.DISEASES
+    print(f"\nQueries for {len(diseases)} diseases over {n:,} patients")
+
+    # The like-for-like baseline: one scan per disease, with no output formatting
+    per_disease = _timed(lambda: [hospital.find_patients_by_disease(d) for d in diseases],
+                         clear=False)
+    _rate("find_patients_by_disease x N", n, per_disease)
+    _rate("search_patients_by_diseases", n,
+          _timed(lambda: hospital.search_patients_by_diseases(diseases), clear=False), per_disease)
+    _rate("disease_histogram", n, _timed(hospital.disease_histogram, clear=False), per_disease)
+
+    groups = hospital.search_patients_by_diseases(diseases)
+    histogram = hospital.disease_histogram()
+
+    # Both group diseases case-insensitively, so compare on lower-case names
+    if {d.lower(): len(g) for d, g in groups.items()} != \
+            {d.lower(): count for d, count in histogram.items()}:
+        raise SystemExit("Batch query and histogram disagree.")
+
+
+if __name__ == "__main__":
+    main()
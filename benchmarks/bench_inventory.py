@@ -0,0 +1,82 @@
+"""
+Benchmark: a week of shows on 20 screens with only a few resident in memory.
+
+Usage:
+    python -m benchmarks.bench_inventory [--screens 20] [--days 7] [--resident 50] [--bookings 20000]
+
+Five shows a day on every screen (700 for the defaults) take random bookings
+while at most ``--resident`` shows stay in memory; the rest are evicted to disk
+and reloaded on demand. Shows are picked uniformly at random, the worst case
+for the resident limit. Every booking is checked against a plain dict of sets
+at the end; then the past days are evicted and finally purged.
+"""
+
+import argparse
+import random
+import string
+import time
+from datetime import datetime, timedelta
+
+from bitlabs.inventory import InventoryService, SeatLayout
+
+SHOWS_PER_DAY = 5
+FIRST_SHOWTIME = datetime(2026, 1, 5, 12, 0)
+
+
+def build_service(num_screens: int, days: int, max_resident: int) -> InventoryService:
+    """Adds the screens, spread over four cinemas, and schedules every show."""
+    service = InventoryService(max_resident_shows=max_resident)
+    layout = SeatLayout(string.ascii_uppercase[:12], 20, initial_booked={("A", 1), ("A", 2)})
+    for screen in range(num_screens):
+        cinema = f"cinema-{screen % 4}"
+        service.add_screen(cinema, screen, layout)
+        for day in range(days):
+            for slot in range(SHOWS_PER_DAY):
+                showtime = FIRST_SHOWTIME + timedelta(days=day, hours=3 * slot)
+                service.schedule_show(cinema, screen, showtime)
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--screens", type=int, default=20)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--resident", type=int, default=50)
+    parser.add_argument("--bookings", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print("--- Seat Inventory Benchmark ---")
+    with build_service(args.screens, args.days, args.resident) as service:
+        shows = service.shows()
+        layout = SeatLayout(string.ascii_uppercase[:12], 20)
+        print(f"  {len(shows):,} shows, at most {args.resident} resident\n")
+
+        expected = {key: set() for key in shows}
+        start = time.perf_counter()
+        for _ in range(args.bookings):
+            key = rng.choice(shows)
+            seat = (rng.choice(layout.rows), rng.randint(1, layout.seats_per_row))
+            if service.book_seat(*key, *seat):
+                expected[key].add(seat)
+        elapsed = time.perf_counter() - start
+        print(f"  {'book_seat':<28} {elapsed * 1000:10.1f} ms  "
+              f"{args.bookings / elapsed:>12,.0f} ops/s")
+        print(f"  resident after bookings      {service.resident_count:>10}")
+
+        start = time.perf_counter()
+        for key in shows:
+            if service.get_booked_seats(*key) != expected[key] | {("A", 1), ("A", 2)}:
+                raise SystemExit(f"Bookings of {key!r} were lost across eviction.")
+        elapsed = time.perf_counter() - start
+        print(f"  {'verify every show':<28} {elapsed * 1000:10.1f} ms")
+
+        now = FIRST_SHOWTIME + timedelta(days=args.days // 2)
+        evicted = service.evict_past(now)
+        print(f"  evict_past evicted {evicted} resident shows, {service.resident_count} left")
+        purged = service.purge_past(now)
+        print(f"  purge_past removed {purged} shows, {len(service.shows())} still scheduled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: print-per-line output vs. the buffered renderer.
+
+Usage:
+    python -m benchmarks.bench_render [--trips 100000] [--rows 26] [--seats 2000]
+
+Each report is written to a temporary file. The "print" variants reproduce
+the original line-by-line implementations for comparison.
+"""
+
+import argparse
+import contextlib
+import random
+import string
+import tempfile
+import time
+
+from benchmarks import generators
+from bitlabs import booking, taxi
+from bitlabs.render import Renderer
+
+
+# --- Original Implementations ---
+
+def _print_analyze_trips(trips):
+    """analyze_trips as it was: one print call per line."""
+    print("\n--- Taxi Fare Calculation ---")
+    print(f"Rates: Base Fare = ${taxi.BASE_FARE}, Distance Rate = ${taxi.RATE_PER_KM}/km")
+    print("-" * 30)
+    total_fare_for_all_trips = 0
+    for i, distance in enumerate(trips):
+        fare = taxi.calculate_trip_fare(distance)
+        total_fare_for_all_trips += fare
+        print(f"Trip {i + 1}: ${fare} ({distance} km)")
+    print("-" * 30)
+    print(f"Total Fare: ${total_fare_for_all_trips}")
+    print("=" * 30)
+
+
+def _print_display_status():
+    """display_status as it was: rows built with += and one print call per line."""
+    booked_seats = booking.booked_seats
+    print("\n" + "=" * 60)
+    print("CINEMA HALL STATUS")
+    print("-" * 60)
+    print("  ")
+    print("  SEATING MAP (A=Front, C=Back):")
+    header = "  Row |" + " ".join(f"{i:^3}" for i in range(1, booking.SEATS_PER_ROW + 1)) + " |"
+    print(header)
+    print("  " + "-" * len(header))
+    for row in booking.ROWS:
+        row_display = f"  {row}   |"
+        for seat in range(1, booking.SEATS_PER_ROW + 1):
+            if (row, seat) in booked_seats:
+                row_display += " [X] "
+            else:
+                row_display += " [O] "
+        print(row_display + " |")
+    booked_list = sorted([f"{r}{s}" for r, s in booked_seats])
+    available_list = sorted([f"{r}{s}" for r, s in booking.get_available_seats()])
+    print("\n" + "-" * 60)
+    print(f"Total Seats: {booking.TOTAL_SEATS}")
+    print(f"Seats Booked ({len(booked_seats)}): {', '.join(booked_list)}")
+    print(f"Seats Available ({len(available_list)}): {', '.join(available_list)}")
+    print("=" * 60 + "\n")
+
+
+# --- Measurement ---
+
+def _time_to_file(func, repeats: int) -> float:
+    """Returns the best wall time of ``func`` with standard output sent to a temp file."""
+    best = float("inf")
+    for _ in range(repeats):
+        with tempfile.TemporaryFile("w+") as f, contextlib.redirect_stdout(f):
+            start = time.perf_counter()
+            func()
+            f.flush()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(title: str, timings: dict):
+    print(f"\n{title}")
+    baseline = timings["print per line"]
+    for label, elapsed in timings.items():
+        print(f"  {label:<16} {elapsed * 1000:10.1f} ms  ({baseline / elapsed:5.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trips", type=int, default=100_000)
+    parser.add_argument("--rows", type=int, default=26)
+    parser.add_argument("--seats", type=int, default=2000, help="Seats per row.")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print("--- Rendering Benchmark ---")
+
+    trips = [distance for (distance,) in generators.trip_distances(args.trips, random.Random(0))]
+    _report(f"analyze_trips, {args.trips:,} trips", {
+        "print per line": _time_to_file(lambda: _print_analyze_trips(trips), args.repeats),
+        "buffered": _time_to_file(lambda: taxi.analyze_trips(trips), args.repeats),
+        "quiet": _time_to_file(
+            lambda: taxi.analyze_trips(trips, renderer=Renderer(quiet=True)), args.repeats
+        ),
+    })
+
+    # A large hall with roughly half of the seats booked
+    booking.ROWS = list(string.ascii_uppercase[:args.rows])
+    booking.SEATS_PER_ROW = args.seats
+    booking.TOTAL_SEATS = args.rows * args.seats
+    rng = random.Random(0)
+    booked = booking.booked_seats
+    booked.clear()
+    booked.update(
+        (row, seat) for row in booking.ROWS for seat in range(1, args.seats + 1) if rng.random() < 0.5
+    )
+    _report(f"display_status, {args.rows} x {args.seats:,} seats", {
+        "print per line": _time_to_file(_print_display_status, args.repeats),
+        "buffered": _time_to_file(booking.display_status, args.repeats),
+        # The status computation alone, which dominates on large halls
+        "get_status only": _time_to_file(booking.get_status, args.repeats),
+        "quiet": _time_to_file(
+            lambda: booking.display_status(renderer=Renderer(quiet=True)), args.repeats
+        ),
+    })
+
+
+if __name__ == "__main__":
+    main()
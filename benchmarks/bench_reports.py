@@ -0,0 +1,68 @@
+"""
+Benchmark: serial vs. process-pool district reports.
+
+Usage:
+    python -m benchmarks.bench_reports [--classes 2000] [--students 40] [--marks 12]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from bitlabs.reports import generate_report_parallel, generate_report_serial
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def make_district(num_classes: int, students_per_class: int, marks_per_student: int,
+                  seed: int = 0) -> dict:
+    """Builds a synthetic district of classes with random marks (0-100)."""
+    rng = random.Random(seed)
+    return {
+        f"Class-{c}": {
+            f"Student-{c}-{s}": [rng.randint(0, 100) for _ in range(marks_per_student)]
+            for s in range(students_per_class)
+        }
+        for c in range(num_classes)
+    }
+
+
+def _best_time(func, repeats: int) -> float:
+    """Returns the fastest wall-clock time (seconds) over ``repeats`` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--classes", type=int, default=2000)
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--marks", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    district = make_district(args.classes, args.students, args.marks)
+    print(f"--- District Report Benchmark ({os.cpu_count()} CPUs) ---")
+    print(f"{args.classes} classes x {args.students} students x {args.marks} marks")
+
+    serial_report = generate_report_serial(district)
+    serial_time = _best_time(lambda: generate_report_serial(district), args.repeats)
+    print(f"{'serial':<10} {serial_time:8.3f}s  speedup 1.00x")
+
+    for workers in WORKER_COUNTS:
+        parallel_report = generate_report_parallel(district, max_workers=workers)
+        if parallel_report != serial_report:
+            raise SystemExit(f"Report mismatch with {workers} workers.")
+        elapsed = _best_time(
+            lambda: generate_report_parallel(district, max_workers=workers), args.repeats
+        )
+        print(f"{workers:>2} workers {elapsed:8.3f}s  speedup {serial_time / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
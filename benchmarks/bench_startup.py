@@ -0,0 +1,74 @@
+"""
+Benchmark: spawning an interpreter per request vs. importing once and calling.
+
+Usage:
+    python -m benchmarks.bench_startup [--spawns 20] [--calls 10000]
+"""
+
+import argparse
+import contextlib
+import os
+import subprocess
+import sys
+import time
+
+from bitlabs import booking, hospital
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One request handled by a fresh interpreter, the way workers had to do it before
+SPAWN_REQUEST = (
+    "import bitlabs.booking as b, bitlabs.hospital as h; "
+    "b.book_seat('A', 1); h.search_patients_by_disease('Flu')"
+)
+IMPORT_ONLY = (
+    "import time; t = time.perf_counter(); import bitlabs.booking, bitlabs.hospital; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def _spawn_seconds(code: str, count: int) -> list:
+    """Runs ``code`` in ``count`` fresh interpreters and returns each wall time."""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True,
+                       stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _in_process_seconds(calls: int) -> float:
+    """Returns the mean time of one book_seat + search call in this process."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(calls):
+            booking.book_seat('A', 1)
+            hospital.search_patients_by_disease('Flu')
+        return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spawns", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=10_000)
+    args = parser.parse_args()
+
+    spawn = _spawn_seconds(SPAWN_REQUEST, args.spawns)
+    imports = [
+        float(subprocess.run([sys.executable, "-c", IMPORT_ONLY], cwd=REPO_ROOT, check=True,
+                             capture_output=True, text=True).stdout)
+        for _ in range(args.spawns)
+    ]
+    in_process = _in_process_seconds(args.calls)
+
+    spawn_mean = sum(spawn) / len(spawn)
+    print("--- Startup Benchmark ---")
+    print(f"Fresh interpreter per request: {spawn_mean * 1000:10.3f} ms/request")
+    print(f"Package import (cold):         {min(imports) * 1000:10.3f} ms (one-off)")
+    print(f"Import once, call directly:    {in_process * 1000:10.3f} ms/request")
+    print(f"Speedup: {spawn_mean / in_process:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
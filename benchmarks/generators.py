@@ -0,0 +1,73 @@
+"""
+Synthetic data generators for the benchmark suite.
+
+Every generator is deterministic for a given ``random.Random`` instance.
+Generators that produce one argument tuple per call are lazy, so even the
+largest scales (1e7 records) never hold every record in memory at once.
+"""
+
+import math
+import random
+import string
+
+DISEASES = ["Flu", "Diabetes", "Hypertension", "Asthma", "Migraine",
+            "Arthritis", "Covid", "Malaria", "Anemia", "Bronchitis"]
+
+
+def trip_distances(n: int, rng: random.Random):
+    """Yields ``n`` (distance_km,) tuples between 0.5 and 60 km."""
+    for _ in range(n):
+        yield (round(rng.uniform(0.5, 60.0), 1),)
+
+
+def ratings(n: int, rng: random.Random) -> list:
+    """Returns a list of ``n`` integer ratings (1-5)."""
+    return [rng.randint(1, 5) for _ in range(n)]
+
+
+def carts(n: int, rng: random.Random, catalog: dict, max_items: int = 8):
+    """
+    Yields ``n`` (cart_items, custom_discount_percent) tuples.
+
+    Each cart holds a random selection of catalog items, keyed by item name
+    as built by the interactive prompts.
+    """
+    products = list(catalog.values())
+    max_items = min(max_items, len(products))
+    for _ in range(n):
+        selection = rng.sample(products, rng.randint(1, max_items))
+        cart_items = {item['name']: item['price'] for item in selection}
+        yield (cart_items, float(rng.choice((0, 5, 10, 15))))
+
+
+def patients(n: int, rng: random.Random, patient_class) -> list:
+    """Returns a list of ``n`` patient objects with random ages and diseases."""
+    return [
+        patient_class(f"Patient{i}", rng.randint(1, 99), rng.choice(DISEASES))
+        for i in range(n)
+    ]
+
+
+def seat_hall(n: int, row_count: int = 26):
+    """
+    Returns (rows, seats_per_row) for a hall with room for at least ``n`` seats.
+
+    The row count is fixed so row validation cost does not grow with ``n``.
+    """
+    rows = list(string.ascii_uppercase[:row_count])
+    return rows, max(1, math.ceil(n / len(rows)))
+
+
+def seat_requests(n: int, rows: list, seats_per_row: int):
+    """Yields ``n`` distinct (row_label, seat_number) booking requests."""
+    for i in range(n):
+        row_index, seat_index = divmod(i, seats_per_row)
+        yield (rows[row_index], seat_index + 1)
+
+
+def classroom(n: int, rng: random.Random, marks_per_student: int = 5) -> dict:
+    """Returns a students dictionary of ``n`` students with random marks (0-100)."""
+    return {
+        f"Student{i}": [rng.randint(0, 100) for _ in range(marks_per_student)]
+        for i in range(n)
+    }
@@ -0,0 +1,407 @@
+"""
+Unified performance benchmark suite for the seven bitLabs systems.
+
+Usage:
+    python -m benchmarks.run [--scales 1e3 1e4 1e5] [--cases taxi cart ...]
+                             [--output results.json] [--baseline baseline.json]
+                             [--threshold 0.10]
+
+Each case drives one system's core function over synthetic data. For every
+case and scale the suite records throughput (records/sec), peak traced memory
+and per-call latency percentiles. Results are written as JSON; when a baseline
+file is given, any case that got slower (or hungrier) than the threshold
+allows is reported as a regression and the exit status is 1.
+
+Throughput comes from whole passes timed in batches, with no clock reading per
+call. After a warmup pass every case is run ``--repeats`` times, interleaved
+with the other cases, and its best run is reported, since background noise
+only ever slows a run down. Latency percentiles come from a separate pass that
+times every call, so the timer overhead only affects the percentiles.
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import islice
+
+from benchmarks import generators
+from bitlabs import booking, cart, classroom, feedback, hospital, restaurant, taxi
+
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_REPEATS = 5
+# A throughput run repeats the whole pass until it has taken at least this long,
+# so small scales are not timed over a fraction of a millisecond
+MIN_RUN_SECONDS = 0.05
+# Arguments are generated this many calls at a time, outside the timed region
+BATCH_CALLS = 10_000
+# Scan-style cases call the function this many times over the full data set
+SCAN_REPEATS = 5
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+# --- Benchmark Cases ---
+# Each case receives the scale and a seeded Random instance and returns
+# (function, iterable of argument tuples, records processed per call).
+
+def _case_taxi(n, rng):
+    return taxi.calculate_trip_fare, generators.trip_distances(n, rng), 1
+
+
+def _case_feedback(n, rng):
+    data = generators.ratings(n, rng)
+    return feedback.calculate_positive_percentage, [(data,)] * SCAN_REPEATS, n
+
+
+def _case_cart(n, rng):
+    return cart.calculate_cart_total, generators.carts(n, rng, cart.CATALOG), 1
+
+
+def _case_restaurant(n, rng):
+    return restaurant.calculate_order_total, generators.carts(n, rng, restaurant.CATALOG), 1
+
+
+def _case_hospital(n, rng):
+    hospital.patient_records = generators.patients(n, rng, hospital.Patient)
+    terms = [(rng.choice(generators.DISEASES),) for _ in range(SCAN_REPEATS)]
+    return hospital.search_patients_by_disease, terms, n
+
+
+def _case_booking(n, rng):
+    rows, seats_per_row = generators.seat_hall(n)
+    booking.ROWS = rows
+    booking.SEATS_PER_ROW = seats_per_row
+    booking.TOTAL_SEATS = len(rows) * seats_per_row
+    booking.booked_seats = set()
+    return booking.book_seat, generators.seat_requests(n, rows, seats_per_row), 1
+
+
+def _case_classroom(n, rng):
+    data = generators.classroom(n, rng)
+    return classroom.track_performance, [(data,)] * SCAN_REPEATS, n
+
+
+CASES = {
+    "taxi": ("bitlabs.taxi", "calculate_trip_fare", _case_taxi),
+    "feedback": ("bitlabs.feedback", "calculate_positive_percentage", _case_feedback),
+    "cart": ("bitlabs.cart", "calculate_cart_total", _case_cart),
+    "restaurant": ("bitlabs.restaurant", "calculate_order_total", _case_restaurant),
+    "hospital": ("bitlabs.hospital", "search_patients_by_disease", _case_hospital),
+    "booking": ("bitlabs.booking", "book_seat", _case_booking),
+    "classroom": ("bitlabs.classroom", "track_performance", _case_classroom),
+}
+
+# Module attributes a case's setup replaces; run_case puts them back afterwards
+CASE_STATE = {
+    "hospital": (hospital, ("patient_records",)),
+    "booking": (booking, ("ROWS", "SEATS_PER_ROW", "TOTAL_SEATS", "booked_seats")),
+}
+
+
+# --- Measurement ---
+
+def _time_calls(func, calls) -> array:
+    """Calls ``func`` once per argument tuple and returns per-call latencies (ns)."""
+    latencies = array('q')
+    clock = time.perf_counter_ns
+    record = latencies.append
+    for args in calls:
+        start = clock()
+        func(*args)
+        record(clock() - start)
+    return latencies
+
+
+def _run_calls(func, calls):
+    """Calls ``func`` once per argument tuple without recording anything."""
+    for args in calls:
+        func(*args)
+
+
+def _batch_ns(func, calls) -> tuple:
+    """
+    Calls ``func`` once per argument tuple without a clock reading per call.
+
+    Arguments are pulled BATCH_CALLS at a time and only the calls themselves
+    are timed, so generating the data is not counted.
+
+    Returns:
+        (total time in ns, number of calls).
+    """
+    calls = iter(calls)
+    clock = time.perf_counter_ns
+    total_ns = count = 0
+    # As in timeit, garbage collection left over from building the data set
+    # must not land inside the timed region
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        while True:
+            batch = list(islice(calls, BATCH_CALLS))
+            if not batch:
+                return total_ns, count
+            start = clock()
+            for args in batch:
+                func(*args)
+            total_ns += clock() - start
+            count += len(batch)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _throughput_run(setup, scale: int, seed: int) -> float:
+    """
+    Runs fresh passes of a case until MIN_RUN_SECONDS have been spent.
+
+    Returns:
+        Records processed per second over those passes.
+    """
+    total_ns = records = 0
+    while total_ns < MIN_RUN_SECONDS * 1e9:
+        func, calls, records_per_call = setup(scale, random.Random(seed))
+        elapsed_ns, count = _batch_ns(func, calls)
+        total_ns += elapsed_ns
+        records += count * records_per_call
+        if not records:
+            return 0.0
+    return records / (total_ns / 1e9)
+
+
+def _percentile(sorted_values, pct: float) -> int:
+    """Returns the nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+@contextlib.contextmanager
+def _restored_state(case_name: str):
+    """Puts back the module attributes a case's setup replaces."""
+    module, names = CASE_STATE.get(case_name, (None, ()))
+    saved = {name: getattr(module, name) for name in names}
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def measure_throughput(case_name: str, scale: int, seed: int = 0) -> float:
+    """Runs one extra throughput run of a case and returns its records/sec."""
+    setup = CASES[case_name][2]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+            _restored_state(case_name):
+        return _throughput_run(setup, scale, seed)
+
+
+def _add_run(result: dict, ops_per_sec: float):
+    """Adds a throughput run to a result and keeps its best run as ``ops_per_sec``."""
+    result["ops_per_sec_runs"].append(ops_per_sec)
+    result["repeats"] = len(result["ops_per_sec_runs"])
+    result["ops_per_sec"] = max(result["ops_per_sec_runs"])
+    result["total_seconds"] = (result["records"] / result["ops_per_sec"]
+                               if result["ops_per_sec"] else 0.0)
+
+
+def run_case(case_name: str, scale: int, seed: int = 0, measure_memory: bool = True,
+             repeats: int = DEFAULT_REPEATS) -> dict:
+    """
+    Runs one benchmark case at one scale.
+
+    Output from the systems' print statements is discarded while measuring,
+    and module state replaced by the case is restored afterwards.
+
+    Args:
+        repeats: Number of throughput runs; the best one is reported.
+
+    Returns:
+        A result dictionary with throughput, peak memory and latency percentiles.
+    """
+    module_name, function_name, setup = CASES[case_name]
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+            _restored_state(case_name):
+        # Warmup: fills caches and lazily created state before anything is timed
+        func, calls, _ = setup(scale, random.Random(seed))
+        _run_calls(func, calls)
+
+        runs = [_throughput_run(setup, scale, seed) for _ in range(max(1, repeats))]
+
+        # Latency pass: every call is timed on its own, for the percentiles only
+        func, calls, records_per_call = setup(scale, random.Random(seed))
+        latencies = _time_calls(func, calls)
+
+        peak_memory = None
+        if measure_memory:
+            # Separate pass: tracemalloc slows every allocation down
+            func, calls, _ = setup(scale, random.Random(seed))
+            tracemalloc.start()
+            try:
+                _run_calls(func, calls)
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    ops_per_sec = max(runs)
+    records = len(latencies) * records_per_call
+    ordered = sorted(latencies)
+    return {
+        "case": case_name,
+        "module": module_name,
+        "function": function_name,
+        "scale": scale,
+        "calls": len(latencies),
+        "records": records,
+        "repeats": len(runs),
+        "total_seconds": records / ops_per_sec if ops_per_sec else 0.0,
+        "ops_per_sec": ops_per_sec,
+        "ops_per_sec_runs": runs,
+        "peak_memory_bytes": peak_memory,
+        "latency_ns": {
+            **{f"p{pct:g}": _percentile(ordered, pct) for pct in PERCENTILES},
+            "max": ordered[-1] if ordered else 0,
+        },
+    }
+
+
+def run_suite(case_names, scales, seed: int = 0, measure_memory: bool = True,
+              repeats: int = DEFAULT_REPEATS) -> dict:
+    """
+    Runs every requested case at every scale and returns the JSON report.
+
+    The throughput runs are interleaved: each round goes through every case
+    once, so a slow spell on the machine hits one run of many cases rather
+    than every run of one case.
+    """
+    pairs = [(case_name, scale) for case_name in case_names for scale in scales]
+    results = [run_case(case_name, scale, seed, measure_memory, repeats=1)
+               for case_name, scale in pairs]
+    for _ in range(repeats - 1):
+        for (case_name, scale), result in zip(pairs, results):
+            _add_run(result, measure_throughput(case_name, scale, seed))
+
+    for result in results:
+        print(
+            f"{result['case']:<11} n={result['scale']:<9,} {result['ops_per_sec']:>14,.0f} rec/s  "
+            f"p99={result['latency_ns']['p99'] / 1000:>10,.1f}us  "
+            f"peak={_format_bytes(result['peak_memory_bytes'])}"
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed,
+            "repeats": repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def _format_bytes(value) -> str:
+    """Formats a byte count for the console summary."""
+    if value is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:,.0f}{unit}"
+        value /= 1024
+    return f"{value:,.1f}GiB"
+
+
+# --- Baseline Comparison ---
+
+def compare_to_baseline(report: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares a report with a stored baseline.
+
+    A case regresses when its best throughput drops, or its peak memory
+    grows, by more than ``threshold`` (a fraction, e.g. 0.10 for 10%).
+
+    Returns:
+        A list of human-readable regression messages (empty if none).
+    """
+    previous = {(r["case"], r["scale"]): r for r in baseline.get("results", [])}
+    regressions = []
+
+    for result in report["results"]:
+        old = previous.get((result["case"], result["scale"]))
+        if old is None:
+            continue
+        label = f"{result['case']} n={result['scale']:,}"
+
+        if old["ops_per_sec"] and result["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+            change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+            regressions.append(
+                f"{label}: throughput {old['ops_per_sec']:,.0f} -> "
+                f"{result['ops_per_sec']:,.0f} rec/s ({change:+.1%})"
+            )
+
+        old_peak, new_peak = old.get("peak_memory_bytes"), result.get("peak_memory_bytes")
+        if old_peak and new_peak and new_peak > old_peak * (1 + threshold):
+            regressions.append(
+                f"{label}: peak memory {_format_bytes(old_peak)} -> "
+                f"{_format_bytes(new_peak)} ({new_peak / old_peak - 1:+.1%})"
+            )
+
+    return regressions
+
+
+# --- Main Program Execution ---
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="bitLabs performance benchmark suite.")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES),
+                        help="Cases to run (default: all).")
+    parser.add_argument("--scales", nargs="+", type=lambda s: int(float(s)),
+                        default=list(DEFAULT_SCALES),
+                        help="Record counts, e.g. 1e3 1e5 1e7 (default: 1e3 1e4 1e5).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="Throughput runs per case; the best is compared (default: 5).")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the tracemalloc pass (peak memory is not recorded).")
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="Compare against this JSON report.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before flagging (default: 0.10).")
+    args = parser.parse_args(argv)
+
+    print("--- bitLabs Benchmark Suite ---")
+    report = run_suite(args.cases, args.scales, args.seed, not args.no_memory, args.repeats)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print(f"\n✅ No regressions beyond {args.threshold:.0%} against {args.baseline}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
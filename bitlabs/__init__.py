@@ -0,0 +1,29 @@
+"""
+The bitLabs mini-systems as an importable package.
+
+Each system is a submodule with no import-time side effects:
+
+    booking     Movie tickets booking system
+    cart        E-commerce cart system
+    classroom   Classroom performance tracker
+    feedback    Customer feedback analysis
+    hospital    Hospital patient management
+    restaurant  Restaurant menu management
+    taxi        Taxi fare calculations
+
+Submodules are imported lazily on first attribute access, so
+``import bitlabs`` stays cheap for processes that only need one system.
+Run a system's interactive program with ``python -m bitlabs <system>``.
+"""
+
+import importlib
+
+SYSTEMS = ("booking", "cart", "classroom", "feedback", "hospital", "restaurant", "taxi")
+
+
+def __getattr__(name):
+    """Imports a system submodule the first time it is accessed."""
+    if name in SYSTEMS:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -0,0 +1,23 @@
+"""
+Command-line entry point: python -m bitlabs <system>
+"""
+
+import importlib
+import sys
+
+from bitlabs import SYSTEMS
+
+
+def main(argv=None) -> int:
+    """Runs the interactive program of the named system."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1 or args[0] not in SYSTEMS:
+        print(f"Usage: python -m bitlabs <system>\nSystems: {', '.join(SYSTEMS)}")
+        return 2
+
+    importlib.import_module(f"bitlabs.{args[0]}").main()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
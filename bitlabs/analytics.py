@@ -0,0 +1,249 @@
+"""
+Cross-order analytics: restaurant and cart orders joined with feedback ratings.
+
+``OrderEventStore`` keeps orders in compact columns (``array`` objects, one
+entry per order or per ordered item) and joins ratings to them by order id.
+Aggregations run as hash-based group-bys (``collections.Counter``) over
+masks and column slices built with C-level helpers (``bytes.translate``,
+``itertools.compress``), so no Python-level loop touches every order.
+"""
+
+from array import array
+from collections import Counter
+from itertools import compress
+
+from bitlabs import cart, restaurant
+
+SOURCES = ("restaurant", "cart")
+
+# Ratings of 4 or 5 count as positive, as in feedback.calculate_positive_percentage
+POSITIVE_RATING = 4
+# Stored rating of an order that has not been rated yet
+UNRATED = 0
+
+# bytes.translate tables turning a ratings column into 0/1 masks
+_RATED_TABLE = bytes(1 if 1 <= value <= 5 else 0 for value in range(256))
+_POSITIVE_TABLE = bytes(1 if POSITIVE_RATING <= value <= 5 else 0 for value in range(256))
+_SOURCE_KEEP_TABLES = {
+    source: bytes(0xFF if value == code else 0 for value in range(256))
+    for code, source in enumerate(SOURCES)
+}
+_RATING_TABLES = {
+    rating: bytes(1 if value == rating else 0 for value in range(256)) for rating in range(1, 6)
+}
+
+
+class OrderEventStore:
+    """
+    Columnar store of orders and their ratings.
+
+    Order columns (one entry per order): order id, source, total, discount
+    percentage and rating. Item columns (one entry per ordered item): item
+    key and the row of the order it belongs to.
+    """
+    def __init__(self):
+        self.order_ids = array('q')
+        self.sources = array('B')
+        self.totals = array('d')
+        self.discounts = array('d')
+        self.ratings = array('B')
+        # Item keys combine the catalog item id and the source: id * 2 + source
+        self.item_keys = array('i')
+        self.item_rows = array('I')
+        # Order id -> row. While ids arrive as first_id, first_id + 1, ... the
+        # row is computed from the id and this index is not built at all.
+        self._first_id = None
+        self._row_index = None
+
+    def __len__(self):
+        return len(self.order_ids)
+
+    # --- Recording ---
+
+    def _row_for(self, order_id: int):
+        """Returns the row of an order, or None if it has not been recorded."""
+        if self._row_index is not None:
+            return self._row_index.get(order_id)
+        if self._first_id is None:
+            return None
+        row = order_id - self._first_id
+        return row if 0 <= row < len(self.order_ids) else None
+
+    def record_order(self, order_id: int, source: str, item_ids, total: float,
+                     discount_percent: float = 0.0) -> int:
+        """
+        Records one order.
+
+        Args:
+            order_id: Unique order id.
+            source: "restaurant" or "cart".
+            item_ids: Catalog ids of the ordered items. An id listed more than
+                      once is recorded once, as the pricing functions count it.
+            total: Final order total (after discounts).
+            discount_percent: The custom discount applied (e.g., 10.0 for 10%).
+
+        Returns:
+            The order's row in the store.
+
+        Raises:
+            ValueError: If the source or an item id is invalid, or the order id
+                        was already recorded. The store is left unchanged.
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Unknown order source '{source}'. Use one of {', '.join(SOURCES)}.")
+        if self._row_for(order_id) is not None:
+            raise ValueError(f"Order {order_id} has already been recorded.")
+
+        # Convert everything before the first append, so a bad value cannot
+        # leave the columns with different lengths
+        source_code = SOURCES.index(source)
+        item_ids = list(dict.fromkeys(item_ids))
+        total = float(total)
+        discount_percent = float(discount_percent)
+        try:
+            item_keys = array('i', [item_id * 2 + source_code for item_id in item_ids])
+        except (TypeError, OverflowError):
+            item_keys = None
+        if item_keys is None or (item_ids and min(item_ids) < 0):
+            raise ValueError(f"Item ids {item_ids} must be non-negative catalog ids.")
+
+        row = len(self.order_ids)
+        self.order_ids.append(order_id)
+        self.sources.append(source_code)
+        self.totals.append(total)
+        self.discounts.append(discount_percent)
+        self.ratings.append(UNRATED)
+        self.item_keys.extend(item_keys)
+        self.item_rows.extend(array('I', [row]) * len(item_ids))
+
+        if self._first_id is None:
+            self._first_id = order_id
+        if self._row_index is None and order_id != self._first_id + row:
+            # Ids are no longer consecutive: switch to a hash index
+            self._row_index = {existing: i for i, existing in enumerate(self.order_ids)}
+        elif self._row_index is not None:
+            self._row_index[order_id] = row
+        return row
+
+    def record_restaurant_order(self, order_id: int, item_ids, discount_percent: float = 0.0) -> float:
+        """
+        Prices a restaurant order with ``restaurant.summarize_order`` and records it.
+
+        Returns:
+            The order total.
+        """
+        item_ids = list(item_ids)
+        items = {restaurant.CATALOG[item_id]['name']: restaurant.CATALOG[item_id]['price']
+                 for item_id in item_ids}
+        total = restaurant.summarize_order(items, discount_percent)["total"]
+        self.record_order(order_id, "restaurant", item_ids, total, discount_percent)
+        return total
+
+    def record_cart_order(self, order_id: int, item_ids, discount_percent: float = 0.0) -> float:
+        """
+        Prices an e-commerce cart with ``cart.summarize_cart`` and records it.
+
+        Returns:
+            The order total.
+        """
+        item_ids = list(item_ids)
+        items = {cart.CATALOG[item_id]['name']: cart.CATALOG[item_id]['price']
+                 for item_id in item_ids}
+        total = cart.summarize_cart(items, discount_percent)["total"]
+        self.record_order(order_id, "cart", item_ids, total, discount_percent)
+        return total
+
+    def record_rating(self, order_id: int, rating: int):
+        """
+        Attaches a customer rating (1-5) to an order, replacing any earlier one.
+
+        Raises:
+            KeyError: If the order has not been recorded.
+            ValueError: If the rating is not between 1 and 5.
+        """
+        if not (isinstance(rating, int) and 1 <= rating <= 5):
+            raise ValueError(f"Rating '{rating}' must be between 1 and 5.")
+        row = self._row_for(order_id)
+        if row is None:
+            raise KeyError(f"Order {order_id} has not been recorded.")
+        self.ratings[row] = rating
+
+    # --- Aggregations ---
+
+    def positive_percentage(self, source: str = None) -> float:
+        """
+        Returns the percentage of rated orders with positive feedback (4 or 5).
+
+        Args:
+            source: Limit to "restaurant" or "cart" orders (default: all).
+
+        Returns:
+            The percentage, or 0.0 if no matching order has been rated.
+        """
+        ratings = self._ratings_bytes(source)
+        rated = ratings.translate(_RATED_TABLE).count(1)
+        if not rated:
+            return 0.0
+        return ratings.translate(_POSITIVE_TABLE).count(1) / rated * 100
+
+    def positive_percentage_by_item(self, source: str) -> dict:
+        """
+        Returns the positive-feedback percentage of every item in rated orders.
+
+        Args:
+            source: "restaurant" (per menu item) or "cart" (per product).
+
+        Returns:
+            dict: Catalog item id -> percentage of its rated orders rated 4 or 5.
+        """
+        source_code = SOURCES.index(source)
+        # Each item row's rating, joined from its order row
+        item_ratings = bytes(map(self.ratings.__getitem__, self.item_rows))
+        rated = Counter(compress(self.item_keys, item_ratings.translate(_RATED_TABLE)))
+        positive = Counter(compress(self.item_keys, item_ratings.translate(_POSITIVE_TABLE)))
+
+        return {
+            key // 2: positive[key] / count * 100
+            for key, count in sorted(rated.items())
+            if key % 2 == source_code
+        }
+
+    def average_discount_by_rating(self, source: str = None) -> dict:
+        """
+        Returns the average discount percentage of orders with each rating.
+
+        Returns:
+            dict: Rating (1-5) -> average discount, for ratings that occur.
+        """
+        return self._average_by_rating(self.discounts, source)
+
+    def average_total_by_rating(self, source: str = None) -> dict:
+        """
+        Returns the average order total of orders with each rating.
+
+        Returns:
+            dict: Rating (1-5) -> average total, for ratings that occur.
+        """
+        return self._average_by_rating(self.totals, source)
+
+    def _ratings_bytes(self, source: str = None) -> bytes:
+        """Returns the ratings column as bytes, with other sources' orders set to UNRATED."""
+        ratings = self.ratings.tobytes()
+        if source is None:
+            return ratings
+        # 0xFF where the order has the wanted source, 0x00 elsewhere; one big-int AND
+        # then applies the mask to every rating at C speed
+        keep = self.sources.tobytes().translate(_SOURCE_KEEP_TABLES[source])
+        masked = int.from_bytes(ratings, "little") & int.from_bytes(keep, "little")
+        return masked.to_bytes(len(ratings), "little")
+
+    def _average_by_rating(self, column: array, source: str = None) -> dict:
+        """Averages ``column`` over the orders of each rating."""
+        ratings = self._ratings_bytes(source)
+        averages = {}
+        for rating, table in _RATING_TABLES.items():
+            mask = ratings.translate(table)
+            count = mask.count(1)
+            if count:
+                averages[rating] = sum(compress(column, mask)) / count
+        return averages
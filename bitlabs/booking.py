@@ -0,0 +1,237 @@
+from itertools import compress
+from operator import not_
+
+from bitlabs.render import emit, output
+
+# --- Configuration ---
+ROWS = ['A', 'B', 'C']  # A is the front row (down), C is the back row (up)
+SEATS_PER_ROW = 5
+TOTAL_SEATS = len(ROWS) * SEATS_PER_ROW
+# Initial booked seats are stored as a set of (row, seat_number) tuples for fast lookup.
+# Example: ('A', 2) means Row A, Seat 2 is booked.
+booked_seats = {('A', 2), ('B', 5), ('C', 1)}
+
+# --- Functions for Seat Management ---
+
+def get_available_seats():
+    """
+    Calculates and returns a list of available (row, seat) tuples.
+    """
+    available_seats = []
+    for row in ROWS:
+        for seat in range(1, SEATS_PER_ROW + 1):
+            seat_tuple = (row, seat)
+            if seat_tuple not in booked_seats:
+                available_seats.append(seat_tuple)
+    return available_seats
+
+def book_seat(row_label, seat_number, renderer=None):
+    """
+    Attempts to book a specific seat.
+
+    The outcome message goes to ``renderer`` (defaults to standard output).
+    Returns True if the seat was booked.
+    """
+    seat_tuple = (row_label, seat_number)
+
+    if row_label not in ROWS or not (1 <= seat_number <= SEATS_PER_ROW):
+        emit(f"❌ Error: Seat {row_label}{seat_number} is an invalid seat identifier.", renderer)
+        return False
+
+    if seat_tuple in booked_seats:
+        emit(f"❌ Error: Seat {row_label}{seat_number} is ALREADY booked.", renderer)
+        return False
+    else:
+        # Book the seat
+        booked_seats.add(seat_tuple)
+        emit(f"✅ Success: Seat {row_label}{seat_number} has been booked.", renderer)
+        return True
+
+def cancel_seat(row_label, seat_number, renderer=None):
+    """
+    Attempts to cancel a booking for a specific seat.
+
+    The outcome message goes to ``renderer`` (defaults to standard output).
+    Returns True if the booking was cancelled.
+    """
+    seat_tuple = (row_label, seat_number)
+
+    if row_label not in ROWS or not (1 <= seat_number <= SEATS_PER_ROW):
+        emit(f"❌ Error: Seat {row_label}{seat_number} is an invalid seat identifier.", renderer)
+        return False
+
+    if seat_tuple in booked_seats:
+        # Cancel the booking (remove the seat tuple)
+        booked_seats.remove(seat_tuple)
+        emit(f"✅ Success: Booking for seat {row_label}{seat_number} has been CANCELLED.", renderer)
+        return True
+    else:
+        emit(f"❌ Error: Seat {row_label}{seat_number} is not currently booked, so it cannot be cancelled.", renderer)
+        return False
+
+def get_status():
+    """
+    Returns the current hall status as data.
+
+    Returns:
+        dict: "total_seats", "booked" and "available" (sorted seat labels,
+              e.g. "A2"), and "rows" (row label -> list of booked flags by seat).
+    """
+    seat_range = range(1, SEATS_PER_ROW + 1)
+    # One pass over the bookings groups the booked seat numbers by row
+    booked_by_row = {row: set() for row in ROWS}
+    for row, seat in booked_seats:
+        if row in booked_by_row:
+            booked_by_row[row].add(seat)
+
+    # Seat numbers in the order their labels sort as text (1, 10, 100, 11, ..., 2, 20, ...),
+    # so every row's labels come out already sorted
+    label_order = sorted(seat_range, key=str)
+    label_texts = [str(seat) for seat in label_order]
+    booked, available = [], []
+    for row in sorted(ROWS):
+        is_booked = list(map(booked_by_row[row].__contains__, label_order))
+        booked += map(row.__add__, compress(label_texts, is_booked))
+        available += map(row.__add__, compress(label_texts, map(not_, is_booked)))
+    # Rows one after another match a text sort only for letter-only row labels and
+    # in-range seats; anything else falls back to sorting
+    if len(booked) != len(booked_seats) or not all(row.isalpha() for row in ROWS):
+        booked = sorted([f"{r}{s}" for r, s in booked_seats])
+        available.sort()
+
+    return {
+        "total_seats": TOTAL_SEATS,
+        "booked": booked,
+        "available": available,
+        "rows": {row: list(map(booked_by_row[row].__contains__, seat_range)) for row in ROWS},
+    }
+
+def format_status(status):
+    """Returns the hall status of ``get_status`` as output lines with a visual map."""
+    # Seat numbers header
+    header = "  Row |" + " ".join(f"{i:^3}" for i in range(1, SEATS_PER_ROW + 1)) + " |"
+
+    lines = [
+        "\n" + "=" * 60,
+        "CINEMA HALL STATUS",
+        "-" * 60,
+        # 1. Visual Map
+        "  ",
+        "  SEATING MAP (A=Front, C=Back):",
+        header,
+        "  " + "-" * len(header),
+    ]
+
+    # Rows: booked seat = X, available seat = O
+    for row, flags in status["rows"].items():
+        cells = "".join([" [X] " if booked else " [O] " for booked in flags])
+        lines.append(f"  {row}   |{cells} |")
+
+    # 2. Summary
+    lines += [
+        "\n" + "-" * 60,
+        f"Total Seats: {status['total_seats']}",
+        f"Seats Booked ({len(status['booked'])}): {', '.join(status['booked'])}",
+        f"Seats Available ({len(status['available'])}): {', '.join(status['available'])}",
+        "=" * 60 + "\n",
+    ]
+    return lines
+
+def display_status(renderer=None):
+    """
+    Prints the current status of the cinema hall with a visual map.
+
+    Args:
+        renderer: Where to write the status (defaults to a buffered writer on
+                  standard output).
+    """
+    with output(renderer) as out:
+        # Nothing is returned, so a quiet renderer needs no status at all
+        if not out.quiet:
+            out.lines(format_status(get_status()))
+
+
+# --- Main Program Execution ---
+
+def main():
+    """Runs the interactive command-line program."""
+    print("--- Interactive Row-Based Booking Simulator ---")
+    print(f"The cinema has {len(ROWS)} rows ({ROWS[0]} to {ROWS[-1]}) with {SEATS_PER_ROW} seats each.")
+    print("Remember: Row A is the front (down), Row C is the back (up).\n")
+
+    while True:
+        # Display current status at the beginning of each loop
+        display_status()
+    
+        # Display Menu
+        print("Please select an action:")
+        print("1: Book Seat(s)")
+        print("2: Cancel a Booking")
+        print("3: Exit System")
+    
+        # Get user choice
+        try:
+            choice = int(input("Enter your choice (1-3): "))
+        except ValueError:
+            print("❌ Invalid input. Please enter a number from 1 to 3.")
+            continue # Skip the rest of the loop and start over
+
+        # Process Choice
+        if choice == 1:
+            # Book Seat(s) - Now handles multiple seats
+            try:
+                # Prompt for multiple seats separated by commas
+                user_input = input("Enter seat(s) to BOOK (e.g., C3, A1, B2): ").strip().upper()
+            
+                # Split the input by comma and clean up each entry
+                seats_to_book = [s.strip() for s in user_input.split(',') if s.strip()]
+
+                if not seats_to_book:
+                     print("⚠️ No valid seats entered. Skipping booking.")
+                     continue
+
+                print(f"\nAttempting to book {len(seats_to_book)} seat(s)...")
+            
+                # Loop through all requested seats
+                for seat_str in seats_to_book:
+                    if len(seat_str) < 2:
+                        print(f"❌ Error: '{seat_str}' is too short. Please use format RowSeat (e.g., B4).")
+                        continue
+                
+                    try:
+                        row = seat_str[0]
+                        seat = int(seat_str[1:])
+                        # Reuse existing single-seat booking logic
+                        book_seat(row, seat) 
+                    except ValueError:
+                        print(f"❌ Error: Seat number in '{seat_str}' is not a valid number.")
+                    except Exception as e:
+                        # Catch any other parsing error
+                        print(f"❌ An unexpected error occurred while processing '{seat_str}': {e}")
+                    
+            except Exception as e:
+                print(f"❌ An error occurred during input processing: {e}")
+            
+        elif choice == 2:
+            # Cancel a Booking (still handles one seat at a time)
+            try:
+                user_input = input("Enter the seat to CANCEL (e.g., A2 for Row A, Seat 2): ").strip().upper()
+                row = user_input[0]
+                seat = int(user_input[1:])
+                cancel_seat(row, seat)
+            except (IndexError, ValueError):
+                print("❌ Invalid format. Please enter in the format: RowSeat (e.g., B4).")
+
+        elif choice == 3:
+            # Exit System
+            print("\nThank you for using the booking system. Goodbye!")
+            break
+        
+        else:
+            print("❌ Invalid choice. Please select 1, 2, or 3.")
+        
+        print("\n" + "~" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import sys
+
+from bitlabs.render import output
+
+# Global Catalog: Define the available products and their prices
+CATALOG = {
+    1: {'name': 'Laptop', 'price': 70000},
+    2: {'name': 'Mobile Phone', 'price': 50000},
+    3: {'name': 'Headphones', 'price': 2000},
+    4: {'name': 'Mouse', 'price': 1000},
+    5: {'name': 'Keyboard', 'price': 1500},
+    6: {'name': 'Monitor', 'price': 15000},
+    7: {'name': 'Webcam', 'price': 800},
+    8: {'name': 'Gaming Chair', 'price': 10000},
+}
+
+# Volume discount: 10% off when the cart holds more than 5 items
+VOLUME_DISCOUNT_RATE = 0.10
+VOLUME_DISCOUNT_MIN_ITEMS = 6
+
+def summarize_cart(cart_items: dict, custom_discount_percent: float) -> dict:
+    """
+    Calculates every step of the cart total without displaying anything.
+
+    Args:
+        cart_items: A dictionary where keys are item names and values are prices
+                    (only for selected items).
+        custom_discount_percent: The additional discount to apply (e.g., 5.0 for 5%).
+
+    Returns:
+        A dictionary with "num_items", "subtotal", "custom_discount_percent",
+        "custom_discount" and "volume_discount" (amounts, 0.0 if not applied),
+        "after_custom_discount", "total" and "total_discounts".
+    """
+    # 1. Calculate the initial subtotal
+    subtotal = sum(cart_items.values()) if cart_items else 0.0
+    num_items = len(cart_items)
+    current_total = subtotal
+
+    # 2. Apply custom discount (Applied first)
+    custom_discount_amount = 0.0
+    if cart_items and custom_discount_percent > 0:
+        custom_discount_amount = current_total * (custom_discount_percent / 100.0)
+        current_total -= custom_discount_amount
+    after_custom_discount = current_total
+
+    # 3. Apply the volume discount (Applied second/last)
+    volume_discount = 0.0
+    if num_items >= VOLUME_DISCOUNT_MIN_ITEMS:
+        volume_discount = current_total * VOLUME_DISCOUNT_RATE
+        current_total -= volume_discount
+
+    return {
+        "num_items": num_items,
+        "subtotal": subtotal,
+        "custom_discount_percent": custom_discount_percent,
+        "custom_discount": custom_discount_amount,
+        "after_custom_discount": after_custom_discount,
+        "volume_discount": volume_discount,
+        "total": current_total if cart_items else 0.0,
+        "total_discounts": 0.0 + custom_discount_amount + volume_discount,
+    }
+
+def format_cart_summary(summary: dict) -> list:
+    """Returns the calculation summary of ``summarize_cart`` as output lines."""
+    if not summary["num_items"]:
+        return ["\nCart is empty. Total price: 0.00"]
+
+    lines = [
+        f"\n--- Calculation Summary ---",
+        f"Total *selected* items in cart: {summary['num_items']}",
+        f"Initial Subtotal: ${summary['subtotal']:,.2f}",
+        "\n--- Step 1: Apply Custom Discount ---",
+    ]
+    if summary["custom_discount_percent"] > 0:
+        lines += [
+            f"Custom Discount ({summary['custom_discount_percent']:.2f}%): -${summary['custom_discount']:,.2f}",
+            f"Total Price After Custom Discount: ${summary['after_custom_discount']:,.2f}",
+        ]
+    else:
+        lines += [
+            "No Custom Discount applied.",
+            f"Current Price: ${summary['after_custom_discount']:,.2f}",
+        ]
+
+    lines.append("\n--- Step 2: Apply Volume Discount ---")
+    if summary["num_items"] >= VOLUME_DISCOUNT_MIN_ITEMS:
+        lines += [
+            f"Volume Discount (10% off for > 5 items): -${summary['volume_discount']:,.2f}",
+            f"Total Price After Volume Discount: ${summary['total']:,.2f}",
+        ]
+    else:
+        lines += [
+            "No Volume Discount applied (Less than 6 items).",
+            f"Current Price: ${summary['total']:,.2f}",
+        ]
+
+    lines += [
+        "\n--- Final Summary ---",
+        f"Total Savings Across All Discounts: ${summary['total_discounts']:,.2f}",
+    ]
+    return lines
+
+def calculate_cart_total(cart_items: dict, custom_discount_percent: float,
+                         renderer=None) -> float:
+    """
+    Calculates the total price of the selected items in the cart, applying
+    cascading discounts, and displays the calculation summary.
+
+    Args:
+        cart_items: A dictionary where keys are item names and values are prices
+                    (only for selected items).
+        custom_discount_percent: The additional discount to apply (e.g., 5.0 for 5%).
+        renderer: Where to write the summary (defaults to a buffered writer on
+                  standard output). Use ``Renderer(quiet=True)`` for no output.
+
+    Returns:
+        The final total price after all applicable discounts.
+    """
+    summary = summarize_cart(cart_items, custom_discount_percent)
+    with output(renderer) as out:
+        if not out.quiet:
+            out.lines(format_cart_summary(summary))
+    return summary["total"]
+
+def get_user_input(catalog: dict):
+    """
+    Displays the catalog and gathers user selections and discount percentage.
+    """
+    cart_items = {}
+    
+    print("\n--- Available Products ---")
+    for item_id, item_info in catalog.items():
+        print(f"[{item_id}] {item_info['name']:<15} - ${item_info['price']:,.2f}")
+    print("--------------------------")
+
+    try:
+        # Get item selections
+        selection_input = input(
+            "Enter the IDs of the items you wish to purchase, separated by commas (e.g., 1, 3, 5): "
+        ).strip()
+        
+        selected_ids = []
+        if selection_input:
+            try:
+                selected_ids = [int(item_id.strip()) for item_id in selection_input.split(',')]
+            except ValueError:
+                print("\nInvalid selection format. Please enter only numbers separated by commas.")
+                return {}, 0.0
+
+        # Build the cart based on valid selections
+        for item_id in selected_ids:
+            if item_id in catalog:
+                item_info = catalog[item_id]
+                # Note: If item name is duplicated (e.g., buying two laptops), 
+                # this simple structure would overwrite the price. 
+                # For simplicity, we assume unique purchases of items from the catalog.
+                cart_items[item_info['name']] = item_info['price']
+            else:
+                print(f"Warning: Item ID {item_id} not found in catalog and was skipped.")
+
+        # Get custom discount
+        custom_discount_percent = float(input("\nEnter the custom discount percentage to apply (e.g., 10 for 10%): "))
+        if custom_discount_percent < 0:
+            print("Discount must be non-negative. Setting to 0%.")
+            custom_discount_percent = 0.0
+
+    except ValueError:
+        print("\nInvalid input detected for discount. Please enter a number only.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
+        sys.exit(1)
+
+    return cart_items, custom_discount_percent
+
+# Main execution block
+def main():
+    """Runs the interactive command-line program."""
+    print("Welcome to the E-Commerce Cart System Calculator.")
+
+    # 1. Display list and get user selection/discount
+    user_cart_items, user_custom_discount = get_user_input(CATALOG)
+
+    # Display the selected items for confirmation
+    if user_cart_items:
+        print("\n--- Cart Contents for Calculation ---")
+        for name, price in user_cart_items.items():
+            print(f"- {name}: ${price:,.2f}")
+        print("-------------------------------------")
+        
+        # 2. Calculate and display the final total
+        final_price = calculate_cart_total(user_cart_items, user_custom_discount)
+
+        # 3. Display the final output
+        print("\n====================================")
+        print(f"FINAL TOTAL PRICE: ${final_price:,.2f}")
+        print("====================================")
+    else:
+        print("\nNo items were selected for purchase.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+import csv
+import json
+import os
+from collections import Counter
+
+from bitlabs.render import emit, output
+
+class Patient:
+    """
+    Represents a patient record with name, age, and disease.
+    This class helps organize the data neatly.
+    """
+    def __init__(self, name, age, disease):
+        self.name = name
+        self.age = age
+        self.disease = disease
+
+    def __str__(self):
+        """Returns a string representation of the patient for easy printing."""
+        return f"Name: {self.name:<10} | Age: {self.age:<3} | Disease: {self.disease}"
+
+    def to_dict(self):
+        """Returns the patient data as a dictionary."""
+        return {"Name": self.name, "Age": self.age, "Disease": self.disease}
+
+# --- Data Storage ---
+# Use a list to store patient objects (records)
+patient_records = [
+    Patient("Alice", 30, "Flu"),
+    Patient("Bob", 45, "Diabetes"),
+    Patient("Charlie", 35, "Flu"),
+    Patient("Diana", 62, "Hypertension")
+]
+
+# --- Core Functions ---
+
+def make_patient(name, age, disease):
+    """
+    Validates raw patient details and builds a Patient from them.
+
+    Args:
+        name, disease (str): Surrounding whitespace is stripped.
+        age (int or str): Must be a positive whole number.
+
+    Raises:
+        ValueError: If a field is empty or the age is invalid.
+    """
+    name = name.strip() if isinstance(name, str) else ""
+    disease = disease.strip() if isinstance(disease, str) else ""
+    # int() accepts surrounding whitespace; floats and bools are not whole-number input
+    if type(age) is not int:
+        try:
+            age = int(age) if isinstance(age, str) else 0
+        except ValueError:
+            age = 0
+    if age <= 0:
+        raise ValueError("Invalid age. Please enter a positive whole number.")
+    if not name or not disease:
+        raise ValueError("All fields must be filled.")
+    return Patient(name, age, disease)
+
+def add_patient(name, age, disease, renderer=None):
+    """
+    Validates one patient's details and adds them to the records.
+
+    Returns:
+        Patient: The new record, or None if the details were invalid.
+    """
+    try:
+        new_patient = make_patient(name, age, disease)
+    except ValueError as e:
+        emit(f"❌ Error: {e}", renderer)
+        return None
+    patient_records.append(new_patient)
+    emit(f"✅ Success: Patient '{new_patient.name}' added to records.", renderer)
+    return new_patient
+
+def add_patient_record():
+    """Prompts the user for details and adds a new patient to the records."""
+    print("\n--- Add New Patient ---")
+    name = input("Enter Patient Name: ").strip()
+    
+    # Input validation for Age
+    while True:
+        try:
+            age = int(input("Enter Patient Age: ").strip())
+            if age <= 0:
+                raise ValueError
+            break
+        except ValueError:
+            print("❌ Invalid age. Please enter a positive whole number.")
+            
+    disease = input("Enter Patient Disease: ").strip()
+    
+    add_patient(name, age, disease)
+
+def find_patients_by_disease(search_term):
+    """
+    Returns every patient whose disease matches ``search_term`` (case-insensitive).
+    """
+    disease = search_term.strip().lower()
+    return [patient for patient in patient_records if patient.disease.lower() == disease]
+
+def search_patients_by_disease(search_term=None, renderer=None):
+    """
+    Searches the patient records for all patients matching a specified disease.
+
+    Args:
+        search_term (str, optional): The disease to search for. If omitted,
+                                     the user is prompted for it.
+        renderer (Renderer, optional): Where to write the results. Defaults to
+                                       a buffered writer on standard output.
+
+    Returns:
+        list: The matching Patient objects.
+    """
+    with output(renderer) as out:
+        out.line("\n--- Search by Disease ---")
+        if search_term is None:
+            # Show the header before prompting
+            out.flush()
+            search_term = input("Enter Disease to Search: ")
+        search_term = search_term.strip()
+
+        if not search_term:
+            out.line("⚠️ Search term cannot be empty.")
+            return []
+
+        found_patients = find_patients_by_disease(search_term)
+
+        if found_patients:
+            out.line(f"\nPatients found with '{search_term}':")
+            out.lines([f"  - {patient.name} (Age: {patient.age})" for patient in found_patients])
+
+            # Expected output format simulation:
+            patient_names = [p.name for p in found_patients]
+            out.line(f"\nExpected Output format: Patients with {search_term}: {patient_names}")
+
+        else:
+            out.line(f"No patients found with the disease '{search_term}'.")
+
+    return found_patients
+
+def display_all_patients(renderer=None):
+    """Displays a formatted list of all current patient records."""
+    with output(renderer) as out:
+        if not patient_records:
+            out.line("The patient database is currently empty.")
+            return
+
+        out.lines([
+            "\n" + "=" * 50,
+            f"CURRENT PATIENT DATABASE ({len(patient_records)} Records)",
+            "-" * 50,
+        ])
+        out.lines([f"| {patient}" for patient in patient_records])
+        out.line("=" * 50)
+
+
+# --- Bulk Operations ---
+
+# Field names, as produced by Patient.to_dict
+IMPORT_FIELDS = ("Name", "Age", "Disease")
+
+def _csv_rows(f):
+    """
+    Yields (line number, [name, age, disease]) from a CSV file with a header row.
+    Rows with missing columns yield (line number, None).
+    """
+    reader = csv.reader(f)
+    header = [column.strip().lower() for column in next(reader, [])]
+    try:
+        columns = [header.index(field.lower()) for field in IMPORT_FIELDS]
+    except ValueError:
+        raise ValueError(f"CSV header must contain the columns {', '.join(IMPORT_FIELDS)}.") from None
+    width = max(columns) + 1
+    in_order = columns == [0, 1, 2]
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            yield reader.line_num, None
+        elif in_order:
+            yield reader.line_num, row[:3]
+        else:
+            yield reader.line_num, [row[i] for i in columns]
+
+def _jsonl_rows(f):
+    """
+    Yields (line number, [name, age, disease]) from a file with one JSON object per line.
+    Keys are "Name", "Age", "Disease" or their lower-case forms. Lines that are
+    not JSON objects yield (line number, None).
+    """
+    loads = json.loads
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            yield line_number, None
+            continue
+        yield line_number, [
+            record[field] if field in record else record.get(field.lower(), "")
+            for field in IMPORT_FIELDS
+        ]
+
+def import_patients(path, file_format=None):
+    """
+    Validates and adds every patient in a CSV or JSONL file in a single pass.
+
+    Invalid rows are skipped and reported; valid ones are appended together
+    once the whole file has been read.
+
+    Args:
+        path (str): The file to import.
+        file_format (str, optional): "csv" or "jsonl". Defaults to the file extension.
+
+    Returns:
+        tuple: (number of patients added, list of (line number, error message)).
+    """
+    file_format = (file_format or os.path.splitext(path)[1].lstrip(".")).lower()
+    if file_format == "csv":
+        read_rows = _csv_rows
+    elif file_format in ("jsonl", "ndjson"):
+        read_rows = _jsonl_rows
+    else:
+        raise ValueError(f"Unsupported patient file format '{file_format}'. Use csv or jsonl.")
+
+    new_patients = []
+    errors = []
+    # utf-8-sig drops a leading byte order mark, as written by spreadsheet exports
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for line_number, fields in read_rows(f):
+            if fields is None:
+                errors.append((line_number, "Malformed row."))
+                continue
+            try:
+                new_patients.append(make_patient(*fields))
+            except ValueError as e:
+                errors.append((line_number, str(e)))
+
+    patient_records.extend(new_patients)
+    return len(new_patients), errors
+
+def search_patients_by_diseases(diseases):
+    """
+    Groups the patients of many diseases in a single scan of the records.
+
+    Args:
+        diseases (iterable of str): The diseases to look for (case-insensitive).
+
+    Returns:
+        dict: Each requested disease -> list of matching Patient objects.
+    """
+    groups = {}
+    results = {}
+    for disease in diseases:
+        # Spellings that differ only in case share one group
+        results[disease] = groups.setdefault(disease.strip().lower(), [])
+
+    for patient in patient_records:
+        group = groups.get(patient.disease.lower())
+        if group is not None:
+            group.append(patient)
+    return results
+
+def disease_histogram():
+    """
+    Counts the patients per disease in a single scan of the records.
+
+    Diseases are matched case-insensitively, as in search_patients_by_disease,
+    and each is reported under the spelling first seen in the records.
+
+    Returns:
+        dict: Disease -> number of patients, most common first.
+    """
+    spelling_counts = Counter([patient.disease for patient in patient_records])
+    counts = Counter()
+    spellings = {}
+    # Only the distinct spellings are merged here; Counter keeps first-seen order
+    for disease, count in spelling_counts.items():
+        counts[spellings.setdefault(disease.lower(), disease)] += count
+    return dict(counts.most_common())
+
+
+# --- Main Program Execution ---
+
+def main():
+    """Runs the interactive command-line program."""
+    print("--- Hospital Patient Management System ---")
+
+    while True:
+        display_all_patients()
+    
+        # Display Menu
+        print("\nPlease select an action:")
+        print("1: Add New Patient Record")
+        print("2: Search Patients by Disease")
+        print("3: Exit System")
+    
+        # Get user choice
+        try:
+            choice = int(input("Enter your choice (1-3): "))
+        except ValueError:
+            print("❌ Invalid input. Please enter a number from 1 to 3.")
+            continue
+
+        # Process Choice
+        if choice == 1:
+            add_patient_record()
+            
+        elif choice == 2:
+            search_patients_by_disease()
+
+        elif choice == 3:
+            print("\nThank you for using the Patient Management System. Goodbye!")
+            break
+        
+        else:
+            print("❌ Invalid choice. Please select 1, 2, or 3.")
+        
+        print("\n" + "~" * 50 + "\n")
+
+
+if __name__ == "__main__":
+    main()
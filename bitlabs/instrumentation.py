@@ -0,0 +1,355 @@
+"""
+Opt-in instrumentation for the hot pricing functions.
+
+Calling ``enable()`` swaps the pricing functions (``calculate_cart_total``,
+``calculate_order_total``, ``calculate_trip_fare`` and the ``summarize_cart`` /
+``summarize_order`` calculations that other modules such as ``analytics``
+call directly) for timing wrappers that feed a fixed-memory, HDR-style latency
+histogram per function. ``disable()`` puts the original
+functions back, so instrumentation costs nothing while it is switched off.
+
+The swap replaces the module attributes (``bitlabs.cart.calculate_cart_total``
+and so on), so only calls that look the function up through its module are
+timed. A name bound earlier with ``from bitlabs.cart import
+calculate_cart_total`` keeps pointing at the original function; call it as
+``cart.calculate_cart_total(...)`` to have it measured. ``snapshot()`` lists
+every enabled function that has recorded no calls under "unmeasured", so such
+a gap shows up instead of passing for an idle function.
+
+Profiling can be switched on for a time window as well: ``cprofile_window()``
+wraps a block of code in ``cProfile``, and ``SamplingProfiler`` samples the
+stacks of a running thread in the background. Everything exports to plain
+dictionaries (and JSON) for machine consumption.
+"""
+
+import cProfile
+import importlib
+import json
+import pstats
+import sys
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from functools import wraps
+
+# Instrumentable functions: public name -> (module, function name)
+HOT_FUNCTIONS = {
+    "cart.calculate_cart_total": ("bitlabs.cart", "calculate_cart_total"),
+    "cart.summarize_cart": ("bitlabs.cart", "summarize_cart"),
+    "restaurant.calculate_order_total": ("bitlabs.restaurant", "calculate_order_total"),
+    "restaurant.summarize_order": ("bitlabs.restaurant", "summarize_order"),
+    "taxi.calculate_trip_fare": ("bitlabs.taxi", "calculate_trip_fare"),
+}
+
+SNAPSHOT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+# --- Latency Histogram ---
+
+class LatencyHistogram:
+    """
+    Records latencies (in nanoseconds) into log-linear buckets, HDR-style.
+
+    Values below ``2 ** sub_bucket_bits`` are counted exactly. Above that,
+    every power-of-two range is split into ``2 ** (sub_bucket_bits - 1)``
+    equal buckets, so the relative error stays below ``2 ** -(sub_bucket_bits - 1)``
+    (under 1% with the default of 8 bits). Memory is fixed at construction
+    time; values above ``highest_ns`` are clamped into the last bucket.
+    """
+    def __init__(self, highest_ns: int = 60 * 10**9, sub_bucket_bits: int = 8):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.highest_ns = highest_ns
+        self._last_index = self._index_for(highest_ns)
+        self.counts = array('q', bytes(8 * (self._last_index + 1)))
+        self.reset()
+
+    def reset(self):
+        """Clears every recorded value."""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def _index_for(self, value: int) -> int:
+        """Maps a value to its bucket index."""
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.sub_bucket_half \
+            + (value >> shift) - self.sub_bucket_half
+
+    def _range_for(self, index: int) -> tuple:
+        """Returns the (lowest, highest) values counted in a bucket."""
+        if index < self.sub_bucket_count:
+            return index, index
+        shift, offset = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        shift += 1
+        sub_bucket = offset + self.sub_bucket_half
+        return sub_bucket << shift, ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_ns: int):
+        """
+        Records one latency sample.
+
+        No lock is taken. Under concurrent callers an update can be lost in any
+        of the counters independently, so ``sum(counts)`` may drift from
+        ``count`` and ``total_ns`` by a few samples; single-threaded use is exact.
+        """
+        if value_ns < 0:
+            value_ns = 0
+        index = self._index_for(value_ns) if value_ns <= self.highest_ns else self._last_index
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Returns the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= target:
+                return min(self._range_for(index)[1], self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> dict:
+        """Returns the histogram summary and its non-empty buckets."""
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "min_ns": self.min_ns or 0,
+            "max_ns": self.max_ns,
+            "percentiles_ns": {
+                f"p{pct:g}": self.value_at_percentile(pct) for pct in SNAPSHOT_PERCENTILES
+            },
+            # [lowest, highest, count] for every bucket that saw a sample
+            "buckets": [
+                [*self._range_for(index), bucket_count]
+                for index, bucket_count in enumerate(self.counts) if bucket_count
+            ],
+        }
+
+
+# --- Function Instrumentation ---
+
+histograms = {name: LatencyHistogram() for name in HOT_FUNCTIONS}
+
+# Original functions, keyed by name, while instrumentation is enabled
+_originals = {}
+
+
+def _timed(func, histogram: LatencyHistogram):
+    """Wraps ``func`` so every call's latency is recorded in ``histogram``."""
+    clock = time.perf_counter_ns
+    record = histogram.record
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(clock() - start)
+
+    return wrapper
+
+
+def enable(names=None):
+    """
+    Installs timing wrappers on the hot functions.
+
+    Args:
+        names: The ``HOT_FUNCTIONS`` names to instrument (defaults to all).
+               Names that are already instrumented are left as they are.
+    """
+    for name in names or HOT_FUNCTIONS:
+        if name in _originals:
+            continue
+        module_name, function_name = HOT_FUNCTIONS[name]
+        module = importlib.import_module(module_name)
+        original = getattr(module, function_name)
+        _originals[name] = original
+        setattr(module, function_name, _timed(original, histograms[name]))
+
+
+def disable(names=None):
+    """Restores the original functions (defaults to all instrumented ones)."""
+    for name in list(names or _originals):
+        original = _originals.pop(name, None)
+        if original is None:
+            continue
+        module_name, function_name = HOT_FUNCTIONS[name]
+        setattr(importlib.import_module(module_name), function_name, original)
+
+
+def is_enabled(name: str) -> bool:
+    """Returns True if the named function is currently instrumented."""
+    return name in _originals
+
+
+def reset():
+    """Clears every recorded latency and call count."""
+    for histogram in histograms.values():
+        histogram.reset()
+
+
+def snapshot() -> dict:
+    """
+    Returns the current call counts and latency histograms.
+
+    "unmeasured" names the enabled functions that have not recorded a single
+    call, e.g. because their callers bound them before ``enable()`` ran.
+    """
+    return {
+        "timestamp": time.time(),
+        "functions": {
+            name: {"enabled": is_enabled(name), **histogram.to_dict()}
+            for name, histogram in histograms.items()
+        },
+        "unmeasured": [
+            name for name, histogram in histograms.items()
+            if is_enabled(name) and not histogram.count
+        ],
+    }
+
+
+def export_snapshot(path: str, extra: dict = None):
+    """
+    Writes ``snapshot()`` to a JSON file.
+
+    Args:
+        path: The destination file.
+        extra: Optional additional top-level entries (e.g. profile captures).
+    """
+    data = snapshot()
+    if extra:
+        data.update(extra)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+# --- Profiling Windows ---
+
+def _profile_to_dict(profile: cProfile.Profile, limit: int = None) -> list:
+    """Converts cProfile results into a list of per-function dictionaries."""
+    stats = pstats.Stats(profile).stats
+    rows = []
+    for (file_name, line, function_name), (primitive_calls, calls, total_time,
+                                            cumulative_time, _callers) in stats.items():
+        rows.append({
+            "function": f"{file_name}:{line}({function_name})",
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_seconds": total_time,
+            "cumulative_seconds": cumulative_time,
+        })
+    rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+@contextmanager
+def cprofile_window(limit: int = None):
+    """
+    Runs the enclosed block under ``cProfile``.
+
+    Yields a dictionary that is filled in when the block exits:
+    "duration_seconds" and "functions" (sorted by cumulative time).
+
+    Example:
+        with cprofile_window(limit=20) as capture:
+            run_checkout_batch()
+        print(capture["functions"])
+    """
+    capture = {}
+    profile = cProfile.Profile()
+    start = time.perf_counter()
+    profile.enable()
+    try:
+        yield capture
+    finally:
+        profile.disable()
+        capture["duration_seconds"] = time.perf_counter() - start
+        capture["functions"] = _profile_to_dict(profile, limit)
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's call stack at a fixed interval from a background thread.
+
+    Unlike ``cprofile_window`` it adds no per-call overhead to the sampled
+    thread, and it can be left running for a time window with ``start(duration)``.
+    Results are stack counts in "folded" form (``outer;inner;leaf`` -> samples).
+    """
+    def __init__(self, interval: float = 0.005, thread_id: int = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = {}
+        self.samples = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _folded_stack(self, frame) -> str:
+        """Returns the frame's stack as ``outer;...;inner`` function labels."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            labels.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def _run(self, duration: float):
+        deadline = None if duration is None else time.monotonic() + duration
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            stack = self._folded_stack(frame)
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+    def start(self, duration: float = None):
+        """Starts sampling; stops on its own after ``duration`` seconds if given."""
+        if self._thread is not None:
+            raise RuntimeError("SamplingProfiler is already running.")
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(duration,), name="bitlabs-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> dict:
+        """Stops sampling (if still running) and returns ``to_dict()``."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        return self.to_dict()
+
+    def to_dict(self) -> dict:
+        """Returns the collected samples, most frequent stacks first."""
+        return {
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "stacks": dict(sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)),
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,317 @@
+"""
+Multi-cinema, multi-screen, multi-show seat inventory.
+
+``bitlabs.booking`` models one hall for one show. ``InventoryService`` keeps
+many shows, keyed by (cinema, screen, showtime):
+
+- Each screen has one ``SeatLayout`` template that all of its shows share.
+- Show state is created lazily on first access. A new show points at the
+  template's initial bookings and copies them only on its first write
+  (copy-on-write), so untouched shows cost almost nothing.
+- Shows that sit idle, are in the past, or exceed the resident limit are
+  evicted. Shows with bookings are written to disk as JSON and reloaded when
+  they are needed again. ``purge_past()`` unschedules past shows altogether.
+
+The storage directory is scratch space for one service: evicted shows are
+read back only by the service that wrote them, never by a new one.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+DEFAULT_MAX_RESIDENT_SHOWS = 256
+
+
+class SeatLayout:
+    """
+    The seat template for one screen, shared by every show on that screen.
+
+    Args:
+        rows: Row labels, front to back (e.g., ['A', 'B', 'C']).
+        seats_per_row: Number of seats in every row.
+        initial_booked: Seats unavailable at the start of every show,
+                        as (row, seat_number) tuples.
+    """
+    def __init__(self, rows, seats_per_row: int, initial_booked=()):
+        self.rows = tuple(rows)
+        self.row_set = frozenset(self.rows)
+        self.seats_per_row = seats_per_row
+        self.total_seats = len(self.rows) * seats_per_row
+        self.initial_booked = frozenset(initial_booked)
+
+    def is_valid(self, row_label, seat_number) -> bool:
+        """Returns True if the seat exists in this layout."""
+        return row_label in self.row_set and 1 <= seat_number <= self.seats_per_row
+
+
+class ShowState:
+    """
+    The bookings of one show.
+
+    ``booked`` starts out as the layout's shared ``initial_booked`` set and is
+    replaced by a private copy on the first booking or cancellation.
+    """
+    __slots__ = ("layout", "booked", "modified", "last_access")
+
+    def __init__(self, layout: SeatLayout, booked=None):
+        self.layout = layout
+        self.booked = layout.initial_booked if booked is None else booked
+        self.modified = booked is not None
+        self.last_access = time.monotonic()
+
+    def _writable(self) -> set:
+        """Returns a private booking set, copying the shared template on first use."""
+        if not self.modified:
+            self.booked = set(self.booked)
+            self.modified = True
+        return self.booked
+
+    def book(self, row_label, seat_number) -> bool:
+        """Books a seat. Returns False if it is invalid or already booked."""
+        seat_tuple = (row_label, seat_number)
+        if not self.layout.is_valid(row_label, seat_number) or seat_tuple in self.booked:
+            return False
+        self._writable().add(seat_tuple)
+        return True
+
+    def cancel(self, row_label, seat_number) -> bool:
+        """Cancels a booking. Returns False if the seat is invalid or not booked."""
+        seat_tuple = (row_label, seat_number)
+        if not self.layout.is_valid(row_label, seat_number) or seat_tuple not in self.booked:
+            return False
+        self._writable().remove(seat_tuple)
+        return True
+
+    def available_seats(self) -> list:
+        """Returns the available (row, seat) tuples in seating-map order."""
+        booked = self.booked
+        return [
+            (row, seat)
+            for row in self.layout.rows
+            for seat in range(1, self.layout.seats_per_row + 1)
+            if (row, seat) not in booked
+        ]
+
+
+class InventoryService:
+    """
+    Seat inventory for many cinemas, screens and showtimes.
+
+    Args:
+        storage_dir: Scratch directory for evicted shows. Defaults to a
+                     temporary directory created on the first eviction that
+                     needs it. Either way the service's files are removed by
+                     ``close()``.
+        max_resident_shows: How many shows to keep in memory; the least
+                            recently used ones beyond this are evicted.
+
+    Raises:
+        ValueError: If max_resident_shows is less than 1.
+    """
+    def __init__(self, storage_dir: str = None,
+                 max_resident_shows: int = DEFAULT_MAX_RESIDENT_SHOWS):
+        if max_resident_shows < 1:
+            raise ValueError(f"max_resident_shows must be at least 1, got {max_resident_shows}.")
+        self.storage_dir = storage_dir
+        self._owns_storage = storage_dir is None
+        self.max_resident_shows = max_resident_shows
+        self._layouts = {}              # (cinema, screen) -> SeatLayout
+        self._shows = set()             # scheduled (cinema, screen, showtime) keys
+        self._resident = OrderedDict()  # key -> ShowState, least recently used first
+        self._on_disk = set()           # keys whose state lives in storage_dir
+        self._lock = threading.RLock()
+
+    # --- Programming ---
+
+    def add_screen(self, cinema, screen, layout: SeatLayout):
+        """Registers (or replaces) the seat layout of a screen."""
+        with self._lock:
+            self._layouts[(cinema, screen)] = layout
+
+    def schedule_show(self, cinema, screen, showtime: datetime):
+        """
+        Schedules a show. No seat state is created until the show is used.
+
+        Raises:
+            KeyError: If the screen has not been added.
+        """
+        with self._lock:
+            if (cinema, screen) not in self._layouts:
+                raise KeyError(f"Unknown screen {screen!r} at cinema {cinema!r}.")
+            self._shows.add((cinema, screen, showtime))
+
+    def shows(self, cinema=None, screen=None) -> list:
+        """Returns the scheduled show keys, optionally filtered, in time order."""
+        return sorted(
+            (key for key in self._shows
+             if (cinema is None or key[0] == cinema) and (screen is None or key[1] == screen)),
+            key=lambda key: (key[2], str(key[0]), str(key[1])),
+        )
+
+    # --- Seat Management ---
+
+    def book_seat(self, cinema, screen, showtime, row_label, seat_number) -> bool:
+        """Books a seat for a show. Returns False if it is invalid or already booked."""
+        with self._lock:
+            return self._state((cinema, screen, showtime)).book(row_label, seat_number)
+
+    def cancel_seat(self, cinema, screen, showtime, row_label, seat_number) -> bool:
+        """Cancels a booking for a show. Returns False if the seat is not booked."""
+        with self._lock:
+            return self._state((cinema, screen, showtime)).cancel(row_label, seat_number)
+
+    def is_booked(self, cinema, screen, showtime, row_label, seat_number) -> bool:
+        """Returns True if the seat is booked for the show."""
+        with self._lock:
+            return (row_label, seat_number) in self._state((cinema, screen, showtime)).booked
+
+    def get_available_seats(self, cinema, screen, showtime) -> list:
+        """Returns the available (row, seat) tuples for a show."""
+        with self._lock:
+            return self._state((cinema, screen, showtime)).available_seats()
+
+    def get_booked_seats(self, cinema, screen, showtime) -> set:
+        """Returns a copy of the booked (row, seat) tuples for a show."""
+        with self._lock:
+            return set(self._state((cinema, screen, showtime)).booked)
+
+    # --- Residency ---
+
+    @property
+    def resident_count(self) -> int:
+        """The number of shows currently held in memory."""
+        return len(self._resident)
+
+    def _state(self, key) -> ShowState:
+        """Returns a show's state, loading or creating it on first access."""
+        state = self._resident.get(key)
+        if state is not None:
+            self._resident.move_to_end(key)
+            state.last_access = time.monotonic()
+            return state
+
+        if key not in self._shows:
+            raise KeyError(f"No show scheduled for {key!r}.")
+
+        layout = self._layouts[key[:2]]
+        if key in self._on_disk:
+            state = ShowState(layout, self._read(key))
+        else:
+            state = ShowState(layout)
+        self._resident[key] = state
+
+        while len(self._resident) > self.max_resident_shows:
+            self._evict(next(iter(self._resident)))
+        return state
+
+    def _evict(self, key):
+        """Drops a show from memory, writing it to disk if it has bookings of its own."""
+        state = self._resident.pop(key)
+        if state.modified:
+            self._write(key, state)
+        # An unmodified show is identical to a freshly created one
+
+    def evict_idle(self, max_idle_seconds: float) -> int:
+        """Evicts shows not accessed within ``max_idle_seconds``. Returns how many."""
+        with self._lock:
+            cutoff = time.monotonic() - max_idle_seconds
+            idle = [key for key, state in self._resident.items() if state.last_access < cutoff]
+            for key in idle:
+                self._evict(key)
+            return len(idle)
+
+    def evict_past(self, now: datetime = None) -> int:
+        """
+        Evicts shows whose showtime is before ``now`` (default: the current time).
+
+        They stay scheduled: a past show with bookings is written to disk and
+        can still be queried. Returns how many shows were evicted.
+        """
+        with self._lock:
+            now = now or datetime.now()
+            past = [key for key in self._resident if key[2] < now]
+            for key in past:
+                self._evict(key)
+            return len(past)
+
+    def purge_past(self, now: datetime = None) -> int:
+        """
+        Unschedules shows whose showtime is before ``now`` (default: the current time).
+
+        Their state is dropped from memory and their files are deleted, so their
+        bookings are gone and the shows can no longer be booked or queried.
+
+        Returns:
+            The number of shows removed.
+        """
+        with self._lock:
+            now = now or datetime.now()
+            past = [key for key in self._shows if key[2] < now]
+            for key in past:
+                self._shows.discard(key)
+                self._resident.pop(key, None)
+                if key in self._on_disk:
+                    self._on_disk.discard(key)
+                    os.remove(self._path(key))
+            return len(past)
+
+    def close(self):
+        """
+        Discards all booking state and removes the service's files.
+
+        A temporary directory created by the service is removed entirely; in a
+        caller-supplied ``storage_dir`` only the files this service wrote are
+        deleted. Scheduled shows stay scheduled, back at their layout's
+        initial bookings.
+        """
+        with self._lock:
+            self._resident.clear()
+            if self._owns_storage:
+                if self.storage_dir is not None:
+                    shutil.rmtree(self.storage_dir, ignore_errors=True)
+                    self.storage_dir = None
+            else:
+                for key in self._on_disk:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(self._path(key))
+            self._on_disk.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- Storage ---
+
+    def _path(self, key) -> str:
+        """Returns the file holding an evicted show."""
+        if self.storage_dir is None:
+            self.storage_dir = tempfile.mkdtemp(prefix="bitlabs-shows-")
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.storage_dir, f"{digest}.json")
+
+    def _write(self, key, state: ShowState):
+        cinema, screen, showtime = key
+        record = {
+            "cinema": cinema,
+            "screen": screen,
+            "showtime": showtime.isoformat() if hasattr(showtime, "isoformat") else showtime,
+            "booked": sorted(state.booked),
+        }
+        with open(self._path(key), "w") as f:
+            json.dump(record, f)
+        self._on_disk.add(key)
+
+    def _read(self, key) -> set:
+        with open(self._path(key)) as f:
+            record = json.load(f)
+        return {(row, seat) for row, seat in record["booked"]}
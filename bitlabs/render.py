@@ -0,0 +1,105 @@
+"""
+Buffered text rendering for the bitLabs reports.
+
+The display functions build their output as lines and hand them to a
+``Renderer``, which joins them and writes them in bulk instead of issuing one
+``print`` per line. Passing one renderer to many calls batches a whole report;
+``Renderer(quiet=True)`` discards the output entirely.
+"""
+
+import sys
+from itertools import islice
+
+# Lines held in memory before the renderer writes them out on its own
+DEFAULT_MAX_BUFFERED_LINES = 8192
+
+
+class Renderer:
+    """
+    Collects output lines and writes them to a stream in large chunks.
+
+    Args:
+        stream: The destination (defaults to ``sys.stdout`` at write time).
+        quiet: If True, every line is dropped and nothing is written.
+        max_buffered_lines: Flush automatically once this many lines are held.
+    """
+    def __init__(self, stream=None, quiet: bool = False,
+                 max_buffered_lines: int = DEFAULT_MAX_BUFFERED_LINES):
+        self.stream = stream
+        self.quiet = quiet
+        self.max_buffered_lines = max_buffered_lines
+        self._lines = []
+
+    def line(self, text: str = ""):
+        """Adds one line of output (without its trailing newline)."""
+        if self.quiet:
+            return
+        self._lines.append(text)
+        if len(self._lines) >= self.max_buffered_lines:
+            self.flush()
+
+    def lines(self, texts):
+        """Adds several lines of output from any iterable, flushing as the buffer fills."""
+        if self.quiet:
+            return
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, self.max_buffered_lines - len(self._lines)))
+            if not chunk:
+                return
+            self._lines.extend(chunk)
+            if len(self._lines) >= self.max_buffered_lines:
+                self.flush()
+
+    def flush(self):
+        """Writes every buffered line to the stream in a single call."""
+        if not self._lines:
+            return
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("\n".join(self._lines) + "\n")
+        self._lines.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+class _Output:
+    """Context manager behind ``output()``; a plain class is cheaper than a generator."""
+    __slots__ = ("renderer", "owned")
+
+    def __init__(self, renderer):
+        self.owned = renderer is None
+        self.renderer = Renderer() if self.owned else renderer
+
+    def __enter__(self):
+        return self.renderer
+
+    def __exit__(self, *exc_info):
+        if self.owned:
+            self.renderer.flush()
+
+
+def output(renderer: Renderer = None):
+    """
+    Returns a context manager yielding the renderer a display function should use.
+
+    If the caller passed no renderer, a temporary one is created for standard
+    output and flushed when the block ends. A caller-supplied renderer is left
+    for its owner to flush, so many calls can share one buffer.
+    """
+    return _Output(renderer)
+
+
+def emit(text: str, renderer: Renderer = None):
+    """
+    Writes a single line: straight to standard output, or into ``renderer``.
+
+    One-line messages gain nothing from a temporary buffer, so this skips it.
+    """
+    if renderer is None:
+        print(text)
+    else:
+        renderer.line(text)
@@ -0,0 +1,180 @@
+"""
+District-wide term reports built from the Classroom Performance Tracker.
+
+Every class is scored with ``track_performance``. Classes are fanned out across
+a ``ProcessPoolExecutor`` and the marks are handed to the workers through one
+shared-memory block, so only small index tables are pickled per task.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from bitlabs.classroom import track_performance
+
+# Marks are stored as doubles in shared memory, so integer and fractional
+# marks are accepted just as in the serial driver (integers are exact up to 2**53)
+MARK_TYPECODE = 'd'
+
+
+# --- Serial Driver ---
+
+def generate_report_serial(classes: dict) -> dict:
+    """
+    Scores every class one after another in the current process.
+
+    Args:
+        classes: A dictionary where keys are class names and values are
+                 student dictionaries (student name -> list of marks).
+
+    Returns:
+        The consolidated report (see ``consolidate_report``).
+    """
+    class_results = {}
+    for class_name, students_data in classes.items():
+        class_results[class_name] = track_performance(students_data)
+    return consolidate_report(class_results)
+
+
+# --- Parallel Driver ---
+
+def _pack_marks(classes: dict):
+    """
+    Flattens all marks into one array and builds per-class index tables.
+
+    Returns:
+        A tuple containing:
+        1. An ``array`` of every mark, class by class and student by student.
+        2. A list of (class name, student names, offsets) tuples, where
+           offsets[i]:offsets[i + 1] is the slice holding student i's marks.
+    """
+    marks = array(MARK_TYPECODE)
+    tables = []
+    for class_name, students_data in classes.items():
+        names = list(students_data)
+        offsets = array('q', [len(marks)])
+        for name in names:
+            marks.extend(students_data[name])
+            offsets.append(len(marks))
+        tables.append((class_name, names, offsets))
+    return marks, tables
+
+
+def _score_tables(buffer, tables: list) -> list:
+    """Scores the given classes against marks read straight from ``buffer``."""
+    all_marks = buffer.cast(MARK_TYPECODE)
+    results = []
+    for class_name, names, offsets in tables:
+        # Memoryview slices are zero-copy and support sum(), len() and truth tests
+        students_data = {
+            name: all_marks[offsets[i]:offsets[i + 1]]
+            for i, name in enumerate(names)
+        }
+        results.append((class_name, track_performance(students_data)))
+    return results
+
+
+def _score_chunk(shm_name: str, tables: list) -> list:
+    """
+    Worker entry point: attaches to the shared marks block and scores a chunk.
+
+    The slices taken inside ``_score_tables`` are released when it returns,
+    which must happen before the shared-memory handle can be closed.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _score_tables(shm.buf, tables)
+    finally:
+        shm.close()
+
+
+def _chunk(items: list, count: int) -> list:
+    """Splits ``items`` into at most ``count`` contiguous, similarly sized chunks."""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def generate_report_parallel(classes: dict, max_workers: int = None,
+                             chunks_per_worker: int = 4) -> dict:
+    """
+    Scores every class across a pool of worker processes.
+
+    All marks are copied once into a shared-memory block. Each task receives
+    only the block name and the student names/offsets of its classes.
+
+    Args:
+        classes: A dictionary where keys are class names and values are
+                 student dictionaries (student name -> list of marks).
+        max_workers: The number of worker processes (defaults to the CPU count).
+        chunks_per_worker: How many tasks to cut per worker, for load balancing.
+
+    Returns:
+        The consolidated report (see ``consolidate_report``).
+    """
+    if not classes:
+        return consolidate_report({})
+
+    marks, tables = _pack_marks(classes)
+    # A zero-size block is not allowed, so always reserve room for one mark
+    shm = shared_memory.SharedMemory(create=True, size=max(len(marks), 1) * marks.itemsize)
+    try:
+        shm.buf[:len(marks) * marks.itemsize] = marks.tobytes()
+
+        workers = max_workers or os.cpu_count() or 1
+        chunks = _chunk(tables, workers * chunks_per_worker)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_score_chunk, shm.name, chunk) for chunk in chunks]
+
+            class_results = {}
+            for future in futures:
+                for class_name, result in future.result():
+                    class_results[class_name] = result
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Keep the caller's class order regardless of completion order
+    return consolidate_report({name: class_results[name] for name in classes})
+
+
+# --- Consolidation ---
+
+def consolidate_report(class_results: dict) -> dict:
+    """
+    Merges per-class ``track_performance`` results into one district report.
+
+    Args:
+        class_results: A dictionary of class name -> (averages, top performer).
+
+    Returns:
+        A dictionary containing:
+        - "classes": class name -> {"averages", "top_performer", "class_average"}
+        - "district_top": (class name, student name, average) of the best
+          student overall, or None if no students were tracked.
+    """
+    classes = {}
+    district_top = None
+
+    for class_name, (averages, top_performer) in class_results.items():
+        class_average = round(sum(averages.values()) / len(averages), 2) if averages else 0.0
+        classes[class_name] = {
+            "averages": averages,
+            "top_performer": top_performer,
+            "class_average": class_average,
+        }
+        # Ties keep the first class encountered, matching track_performance
+        if averages:
+            top_average = averages[top_performer]
+            if district_top is None or top_average > district_top[2]:
+                district_top = (class_name, top_performer, top_average)
+
+    return {"classes": classes, "district_top": district_top}
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from bitlabs import cart, restaurant
+from bitlabs.analytics import SOURCES, OrderEventStore
+
+
+def _random_orders(seed: int = 0, count: int = 400):
+    """Returns (order_id, source, item_ids, total, discount, rating or None) tuples.
+
+    Ids start consecutive and then jump, so the store switches to its hash index.
+    """
+    rng = random.Random(seed)
+    catalogs = {"restaurant": list(restaurant.CATALOG), "cart": list(cart.CATALOG)}
+    orders = []
+    for i in range(count):
+        order_id = 100 + i if i < count // 2 else 10_000 + 7 * i
+        source = rng.choice(SOURCES)
+        item_ids = rng.sample(catalogs[source], rng.randint(1, 3))
+        rating = rng.choice((None, 1, 2, 3, 4, 5))
+        orders.append((order_id, source, item_ids, rng.uniform(5, 500),
+                       rng.choice((0.0, 5.0, 10.0)), rating))
+    return orders
+
+
+def _store(orders) -> OrderEventStore:
+    store = OrderEventStore()
+    for order_id, source, item_ids, total, discount, rating in orders:
+        store.record_order(order_id, source, item_ids, total, discount)
+        if rating is not None:
+            store.record_rating(order_id, rating)
+    return store
+
+
+def _rated(orders, source=None):
+    return [o for o in orders if o[5] is not None and (source is None or o[1] == source)]
+
+
+@pytest.mark.parametrize("source", [None, "restaurant", "cart"])
+def test_positive_percentage_matches_a_plain_loop(source):
+    orders = _random_orders()
+    rated = _rated(orders, source)
+    expected = sum(1 for o in rated if o[5] >= 4) / len(rated) * 100
+    assert _store(orders).positive_percentage(source) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("source", ["restaurant", "cart"])
+def test_positive_percentage_by_item_matches_a_plain_loop(source):
+    orders = _random_orders()
+    rated, positive = {}, {}
+    for o in _rated(orders, source):
+        for item_id in o[2]:
+            rated[item_id] = rated.get(item_id, 0) + 1
+            positive[item_id] = positive.get(item_id, 0) + (o[5] >= 4)
+    expected = {item_id: positive[item_id] / rated[item_id] * 100 for item_id in sorted(rated)}
+    assert _store(orders).positive_percentage_by_item(source) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("source", [None, "restaurant", "cart"])
+def test_averages_by_rating_match_a_plain_loop(source):
+    orders = _random_orders()
+    store = _store(orders)
+    for column, query in ((4, store.average_discount_by_rating), (3, store.average_total_by_rating)):
+        groups = {}
+        for o in _rated(orders, source):
+            groups.setdefault(o[5], []).append(o[column])
+        expected = {rating: sum(values) / len(values) for rating, values in sorted(groups.items())}
+        assert query(source) == pytest.approx(expected)
+
+
+def test_ratings_reach_the_right_order_after_the_index_switch():
+    orders = _random_orders()
+    store = _store(orders)
+    assert store._row_index is not None
+    for row, o in enumerate(orders):
+        assert store.order_ids[row] == o[0]
+        assert store.ratings[row] == (o[5] or 0)
+    with pytest.raises(KeyError):
+        store.record_rating(101 + len(orders), 5)
+
+
+def test_repeated_items_are_recorded_once():
+    store = OrderEventStore()
+    total = store.record_restaurant_order(1, [1, 1, 2])
+    assert total == store.totals[0]
+    assert list(store.item_keys) == [1 * 2, 2 * 2]
+    assert list(store.item_rows) == [0, 0]
+
+
+@pytest.mark.parametrize("bad_order", [
+    (2, "cart", [1], "not a number", 0.0),
+    (2, "cart", [1, -3], 10.0, 0.0),
+    (2, "cart", [1, 2.5], 10.0, 0.0),
+    (2, "shop", [1], 10.0, 0.0),
+    (1, "cart", [1], 10.0, 0.0),
+])
+def test_a_rejected_order_leaves_the_store_unchanged(bad_order):
+    store = OrderEventStore()
+    store.record_order(1, "cart", [3, 4], 20.0)
+    with pytest.raises(ValueError):
+        store.record_order(*bad_order)
+    assert len(store) == 1
+    assert [len(store.sources), len(store.totals), len(store.discounts), len(store.ratings)] == [1] * 4
+    assert list(store.item_rows) == [0, 0]
+    assert store.record_order(2, "cart", [1], 10.0) == 1
@@ -0,0 +1,102 @@
+import codecs
+import json
+
+import pytest
+
+from bitlabs import hospital
+
+
+@pytest.fixture(autouse=True)
+def records(monkeypatch):
+    """Runs every test against its own, initially empty, patient list."""
+    patients = []
+    monkeypatch.setattr(hospital, "patient_records", patients)
+    return patients
+
+
+def _fields(patients):
+    return [(p.name, p.age, p.disease) for p in patients]
+
+
+@pytest.mark.parametrize("age", ["abc", "0", -3, 4.0, 4.5, True, None, ""])
+def test_make_patient_rejects_invalid_ages(age):
+    with pytest.raises(ValueError, match="Invalid age"):
+        hospital.make_patient("Ann", age, "Flu")
+
+
+def test_make_patient_strips_fields_and_accepts_whole_number_strings():
+    patient = hospital.make_patient("  Ann ", " 42 ", " Flu  ")
+    assert (patient.name, patient.age, patient.disease) == ("Ann", 42, "Flu")
+    with pytest.raises(ValueError, match="All fields"):
+        hospital.make_patient("Ann", 42, "   ")
+
+
+def test_csv_import_with_reordered_columns_and_short_rows(tmp_path, records):
+    path = tmp_path / "patients.csv"
+    path.write_text("Disease,Extra,Name,Age\n"
+                    "Flu,x,Ann,30\n"
+                    "Asthma,x,Bob\n"
+                    "\n"
+                    "Covid,x,Cy,4.5\n"
+                    "Malaria,x,Dee,61\n")
+    added, errors = hospital.import_patients(str(path))
+    assert added == 2
+    assert _fields(records) == [("Ann", 30, "Flu"), ("Dee", 61, "Malaria")]
+    assert errors == [(3, "Malformed row."),
+                      (5, "Invalid age. Please enter a positive whole number.")]
+
+
+def test_csv_import_without_the_required_columns(tmp_path):
+    path = tmp_path / "patients.csv"
+    path.write_text("Name,Disease\nAnn,Flu\n")
+    with pytest.raises(ValueError, match="CSV header"):
+        hospital.import_patients(str(path))
+
+
+@pytest.mark.parametrize("suffix, content", [
+    ("csv", "Name,Age,Disease\nAnn,30,Flu\n"),
+    ("jsonl", '{"Name": "Ann", "Age": 30, "Disease": "Flu"}\n'),
+])
+def test_import_accepts_a_byte_order_mark(tmp_path, records, suffix, content):
+    path = tmp_path / f"patients.{suffix}"
+    path.write_bytes(codecs.BOM_UTF8 + content.encode("utf-8"))
+    assert hospital.import_patients(str(path)) == (1, [])
+    assert _fields(records) == [("Ann", 30, "Flu")]
+
+
+def test_jsonl_import_reports_lines_that_are_not_objects(tmp_path, records):
+    lines = [
+        json.dumps({"Name": "Ann", "Age": 30, "Disease": "Flu"}),
+        "[1, 2, 3]",
+        "not json",
+        "",
+        json.dumps({"name": "Bob", "age": True, "disease": "Flu"}),
+        json.dumps({"name": "Cy", "age": "52", "disease": "Asthma"}),
+    ]
+    path = tmp_path / "patients.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    added, errors = hospital.import_patients(str(path))
+    assert added == 2
+    assert _fields(records) == [("Ann", 30, "Flu"), ("Cy", 52, "Asthma")]
+    assert errors == [(2, "Malformed row."), (3, "Malformed row."),
+                      (5, "Invalid age. Please enter a positive whole number.")]
+
+
+def test_import_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        hospital.import_patients(str(tmp_path / "patients.xml"))
+
+
+def test_batch_search_and_histogram_ignore_case(records):
+    for name, disease in [("Ann", "Flu"), ("Bob", "flu"), ("Cy", "Asthma"),
+                          ("Dee", "FLU"), ("Eve", "asthma"), ("Fay", "Covid")]:
+        records.append(hospital.Patient(name, 30, disease))
+
+    groups = hospital.search_patients_by_diseases(["flu", "ASTHMA", "Malaria"])
+    assert {d: [p.name for p in g] for d, g in groups.items()} == {
+        "flu": ["Ann", "Bob", "Dee"], "ASTHMA": ["Cy", "Eve"], "Malaria": []}
+    assert [p.name for p in hospital.find_patients_by_disease("fLu")] == ["Ann", "Bob", "Dee"]
+
+    histogram = hospital.disease_histogram()
+    assert histogram == {"Flu": 3, "Asthma": 2, "Covid": 1}
+    assert list(histogram) == ["Flu", "Asthma", "Covid"]
@@ -0,0 +1,80 @@
+import importlib
+import json
+import random
+
+import pytest
+
+from bitlabs import instrumentation, taxi
+from bitlabs.analytics import OrderEventStore
+from bitlabs.instrumentation import LatencyHistogram
+
+
+@pytest.fixture(autouse=True)
+def _clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_bucket_round_trip_and_error_bound():
+    histogram = LatencyHistogram()
+    rng = random.Random(0)
+    values = list(range(1024)) + [rng.randrange(1, histogram.highest_ns) for _ in range(5000)]
+    for value in values:
+        low, high = histogram._range_for(histogram._index_for(value))
+        assert low <= value <= high
+        assert (high - low) / max(low, 1) < 0.01
+
+
+def test_percentiles_stay_within_the_error_bound():
+    histogram = LatencyHistogram()
+    values = sorted(random.Random(1).randrange(1, 10**8) for _ in range(10_000))
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == sum(histogram.counts) == len(values)
+    for pct in (50, 90, 99):
+        exact = values[int(len(values) * pct / 100) - 1]
+        assert histogram.value_at_percentile(pct) == pytest.approx(exact, rel=0.01)
+
+
+def _current_functions() -> dict:
+    return {name: getattr(importlib.import_module(module), function)
+            for name, (module, function) in instrumentation.HOT_FUNCTIONS.items()}
+
+
+def test_enable_and_disable_restore_the_original_objects():
+    originals = _current_functions()
+    instrumentation.enable()
+    instrumentation.enable()  # a second call must not wrap the wrappers
+    assert all(instrumentation.is_enabled(name) for name in originals)
+    assert all(_current_functions()[name] is not original for name, original in originals.items())
+    instrumentation.disable()
+    assert all(_current_functions()[name] is original for name, original in originals.items())
+
+
+def test_early_bound_callers_are_reported_as_unmeasured():
+    early_bound = taxi.calculate_trip_fare
+    instrumentation.enable(["taxi.calculate_trip_fare", "cart.summarize_cart"])
+    early_bound(12.0)
+    OrderEventStore().record_cart_order(1, [1, 2])
+
+    data = instrumentation.snapshot()
+    assert data["functions"]["cart.summarize_cart"]["count"] == 1
+    assert data["unmeasured"] == ["taxi.calculate_trip_fare"]
+
+
+def test_exported_snapshot_loads_back(tmp_path):
+    instrumentation.enable(["taxi.calculate_trip_fare"])
+    for distance in (1.0, 5.5, 40.0):
+        taxi.calculate_trip_fare(distance)
+    path = tmp_path / "snapshot.json"
+    instrumentation.export_snapshot(str(path), extra={"note": "test"})
+
+    loaded = json.loads(path.read_text())
+    expected = json.loads(json.dumps(instrumentation.snapshot()))
+    assert loaded["note"] == "test"
+    assert loaded["functions"] == expected["functions"]
+    assert loaded["functions"]["taxi.calculate_trip_fare"]["count"] == 3
+    assert loaded["unmeasured"] == []
@@ -0,0 +1,93 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from bitlabs.inventory import InventoryService, SeatLayout
+
+SHOWTIME = datetime(2026, 1, 5, 18, 0)
+LAYOUT = SeatLayout(['A', 'B', 'C'], 5, initial_booked={('A', 2)})
+
+
+def _service(num_shows: int, max_resident: int, storage_dir=None) -> InventoryService:
+    service = InventoryService(storage_dir=storage_dir, max_resident_shows=max_resident)
+    service.add_screen("cinema", 1, LAYOUT)
+    for i in range(num_shows):
+        service.schedule_show("cinema", 1, SHOWTIME + timedelta(hours=i))
+    return service
+
+
+def test_bookings_survive_eviction_and_reload(tmp_path):
+    service = _service(10, max_resident=2, storage_dir=str(tmp_path))
+    for i in range(10):
+        assert service.book_seat("cinema", 1, SHOWTIME + timedelta(hours=i), 'B', i % 5 + 1)
+    assert service.resident_count == 2
+
+    for i in range(10):
+        showtime = SHOWTIME + timedelta(hours=i)
+        assert service.get_booked_seats("cinema", 1, showtime) == {('A', 2), ('B', i % 5 + 1)}
+        assert not service.book_seat("cinema", 1, showtime, 'B', i % 5 + 1)
+        assert service.cancel_seat("cinema", 1, showtime, 'A', 2)
+
+    assert service.evict_idle(0) == 2
+    for i in range(10):
+        assert service.get_booked_seats("cinema", 1, SHOWTIME + timedelta(hours=i)) == \
+            {('B', i % 5 + 1)}
+
+
+def test_unmodified_shows_are_not_written(tmp_path):
+    service = _service(5, max_resident=1, storage_dir=str(tmp_path))
+    for i in range(5):
+        assert service.get_booked_seats("cinema", 1, SHOWTIME + timedelta(hours=i)) == {('A', 2)}
+    assert os.listdir(tmp_path) == []
+
+
+def test_resident_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        InventoryService(max_resident_shows=0)
+
+
+def test_evict_past_writes_past_bookings_to_disk(tmp_path):
+    service = _service(6, max_resident=6, storage_dir=str(tmp_path))
+    for i in range(6):
+        service.book_seat("cinema", 1, SHOWTIME + timedelta(hours=i), 'C', 1)
+    assert os.listdir(tmp_path) == []
+
+    assert service.evict_past(SHOWTIME + timedelta(hours=3)) == 3
+    assert service.resident_count == 3
+    assert len(os.listdir(tmp_path)) == 3
+    assert len(service.shows()) == 6
+    for i in range(6):
+        assert service.is_booked("cinema", 1, SHOWTIME + timedelta(hours=i), 'C', 1)
+
+
+def test_purge_past_unschedules_shows_and_deletes_their_files(tmp_path):
+    service = _service(6, max_resident=1, storage_dir=str(tmp_path))
+    for i in range(6):
+        service.book_seat("cinema", 1, SHOWTIME + timedelta(hours=i), 'C', 1)
+    assert len(os.listdir(tmp_path)) == 5
+
+    assert service.purge_past(SHOWTIME + timedelta(hours=3)) == 3
+    assert [key[2] for key in service.shows()] == [SHOWTIME + timedelta(hours=i) for i in (3, 4, 5)]
+    assert len(os.listdir(tmp_path)) == 2
+    with pytest.raises(KeyError):
+        service.book_seat("cinema", 1, SHOWTIME, 'C', 2)
+    assert service.is_booked("cinema", 1, SHOWTIME + timedelta(hours=4), 'C', 1)
+
+
+def test_close_removes_the_services_files(tmp_path):
+    with _service(3, max_resident=1) as service:
+        for i in range(3):
+            service.book_seat("cinema", 1, SHOWTIME + timedelta(hours=i), 'C', 1)
+        storage_dir = service.storage_dir
+        assert os.path.isdir(storage_dir)
+    assert not os.path.exists(storage_dir)
+
+    (tmp_path / "unrelated.txt").write_text("kept")
+    service = _service(3, max_resident=1, storage_dir=str(tmp_path))
+    for i in range(3):
+        service.book_seat("cinema", 1, SHOWTIME + timedelta(hours=i), 'C', 1)
+    assert len(os.listdir(tmp_path)) == 3
+    service.close()
+    assert os.listdir(tmp_path) == ["unrelated.txt"]
+    assert service.get_booked_seats("cinema", 1, SHOWTIME) == {('A', 2)}
@@ -0,0 +1,32 @@
+import pytest
+
+from bitlabs.reports import generate_report_parallel, generate_report_serial
+
+CASES = {
+    "fractional marks": {
+        "7A": {"Asha": [88.5, 91.25, 79.75], "Ben": [70, 80.5, 90]},
+        "7B": {"Cara": [0.1, 0.2, 0.3], "Dev": [99.99, 100]},
+    },
+    "empty class": {
+        "8A": {},
+        "8B": {"Eli": [60, 70, 80]},
+    },
+    "student with no marks": {
+        "9A": {"Fay": [], "Gus": [55, 65]},
+        "9B": {"Hal": []},
+    },
+    "tied top performers across classes": {
+        "10A": {"Ivy": [90, 80], "Jon": [85, 85]},
+        "10B": {"Kim": [80, 90], "Lee": [70]},
+        "10C": {"Max": [85, 85]},
+    },
+}
+
+
+@pytest.mark.parametrize("classes", CASES.values(), ids=CASES.keys())
+def test_parallel_report_matches_serial(classes):
+    assert generate_report_parallel(classes, max_workers=2) == generate_report_serial(classes)
+
+
+def test_no_classes():
+    assert generate_report_parallel({}, max_workers=2) == generate_report_serial({})